@@ -14,6 +14,9 @@ namespace Cosmos.Build.Common.Tasks;
 /// </summary>
 public sealed class ComputeInputsHashTask : Microsoft.Build.Utilities.Task
 {
+    /// <summary>Size of the reusable buffer input files are streamed through, in bytes.</summary>
+    private const int HashBufferSizeBytes = 81920;
+
     [Required]
     public ITaskItem[] InputFiles { get; set; } = Array.Empty<ITaskItem>();
 
@@ -29,11 +32,20 @@ public sealed class ComputeInputsHashTask : Microsoft.Build.Utilities.Task
             .OrderBy(f => f, StringComparer.OrdinalIgnoreCase)
             .ToArray();
 
+        // Stream each input through one reusable buffer instead of loading it whole:
+        // inputs include the kernel ELF, link objects and every referenced assembly, and a
+        // File.ReadAllBytes per file would put each of them on the large object heap.
         using SHA256 sha = SHA256.Create();
+        byte[] buffer = new byte[HashBufferSizeBytes];
         foreach (string filePath in sortedFiles)
         {
-            byte[] bytes = File.ReadAllBytes(filePath);
-            sha.TransformBlock(bytes, 0, bytes.Length, null, 0);
+            using FileStream stream = new(filePath, FileMode.Open, FileAccess.Read, FileShare.Read,
+                bufferSize: 1, FileOptions.SequentialScan);
+            int bytesRead;
+            while ((bytesRead = stream.Read(buffer, 0, buffer.Length)) > 0)
+            {
+                sha.TransformBlock(buffer, 0, bytesRead, null, 0);
+            }
         }
         sha.TransformFinalBlock(Array.Empty<byte>(), 0, 0);
 
@@ -5,6 +5,7 @@ using System.Collections.Generic;
 using System.Diagnostics;
 using System.IO;
 using System.Linq;
+using System.Runtime.InteropServices;
 using System.Text.RegularExpressions;
 using Microsoft.Build.Framework;
 
@@ -26,6 +27,12 @@ public sealed class ResolveCosmosToolTask : Microsoft.Build.Utilities.Task
 {
     private const int CommandTimeoutMs = 5000;
 
+    /// <summary>Extensions `where` tries when PATHEXT is unset.</summary>
+    private const string DefaultPathExt = ".COM;.EXE;.BAT;.CMD";
+
+    /// <summary>access(2) mode bit asking whether the caller may execute the file.</summary>
+    private const int X_OK = 1;
+
     /// <summary>Logical tool name: clang | lld | xorriso | qemu-x64 | qemu-arm64.</summary>
     [Required]
     public string ToolName { get; set; } = string.Empty;
@@ -181,18 +188,74 @@ public sealed class ResolveCosmosToolTask : Microsoft.Build.Utilities.Task
         return null;
     }
 
+    /// <summary>
+    /// In-process `where`/`which`: walk PATH in order and return the first file
+    /// named <paramref name="command"/> (on Windows, the command plus a PATHEXT
+    /// extension; on Unix, one we may execute). Runs once per tool per build,
+    /// so no process spawn for it.
+    /// </summary>
     private static string? FindOnPath(string command)
     {
-        string finder = Environment.OSVersion.Platform == PlatformID.Win32NT ? "where" : "which";
-        var (success, output) = RunCommand(finder, command);
-        if (!success)
+        string? pathVar = Environment.GetEnvironmentVariable("PATH");
+        if (string.IsNullOrEmpty(pathVar))
         {
             return null;
         }
-        string candidate = output.Split('\n', '\r').FirstOrDefault(l => !string.IsNullOrWhiteSpace(l))?.Trim() ?? "";
-        return File.Exists(candidate) ? candidate : null;
+
+        bool isWindows = Environment.OSVersion.Platform == PlatformID.Win32NT;
+        List<string> names = new List<string>();
+        if (isWindows)
+        {
+            // `where clang` resolves clang.exe, not an extensionless file named clang.
+            if (Path.HasExtension(command))
+            {
+                names.Add(command);
+            }
+            string pathExt = Environment.GetEnvironmentVariable("PATHEXT") ?? DefaultPathExt;
+            names.AddRange(pathExt.Split(new[] { ';' }, StringSplitOptions.RemoveEmptyEntries).Select(ext => command + ext.Trim()));
+        }
+        else
+        {
+            names.Add(command);
+        }
+
+        foreach (string entry in pathVar!.Split(Path.PathSeparator))
+        {
+            // Windows PATH entries may be quoted (e.g. "C:\Program Files\LLVM\bin").
+            string dir = entry.Trim().Trim('"');
+            if (dir.Length == 0 || dir.IndexOfAny(Path.GetInvalidPathChars()) >= 0)
+            {
+                continue;
+            }
+            foreach (string name in names)
+            {
+                string candidate = Path.Combine(dir, name);
+                // A non-executable hit doesn't end the search, as with `which`.
+                if (File.Exists(candidate) && (isWindows || IsExecutable(candidate)))
+                {
+                    return candidate;
+                }
+            }
+        }
+        return null;
+    }
+
+    private static bool IsExecutable(string path)
+    {
+        try
+        {
+            return access(path, X_OK) == 0;
+        }
+        catch (Exception ex) when (ex is DllNotFoundException or EntryPointNotFoundException)
+        {
+            // No libc to ask; the existence check has to do.
+            return true;
+        }
     }
 
+    [DllImport("libc", SetLastError = true)]
+    private static extern int access(string pathname, int mode);
+
     private static string? TryGetVersion(string command)
     {
         var (success, output) = RunCommand(command, "--version");
@@ -1,5 +1,6 @@
 using System.ComponentModel;
 using System.Diagnostics;
+using System.Net;
 using System.IO.Compression;
 using System.Text.Json;
 using Cosmos.Tools.Platform;
@@ -32,6 +33,16 @@ public class InstallCommand : AsyncCommand<InstallSettings>
     internal const string ToolsRepo = "valentinbreiz/nativeaot-patcher";
     internal const string ToolsReleaseTag = "tools-latest";
 
+    // One client for the whole install: the release API lookups and every asset
+    // download share its connection pool, so each host costs one TCP + TLS
+    // handshake instead of one per request.
+    private static readonly HttpClient s_http = CreateHttpClient();
+
+    // Upper bound on one asset download, body included. HttpClient.Timeout
+    // stops at the headers once the body is streamed (ResponseHeadersRead),
+    // so a stalled transfer would otherwise hang the install forever.
+    private static readonly TimeSpan s_downloadTimeout = TimeSpan.FromMinutes(30);
+
     public override async Task<int> ExecuteAsync(CommandContext context, InstallSettings settings)
     {
         string mode = settings.Setup != null
@@ -255,9 +266,8 @@ public class InstallCommand : AsyncCommand<InstallSettings>
 
     internal static async Task<List<ReleaseAsset>> FetchReleaseAssetsAsync(string repo, string tag)
     {
-        using var http = CreateHttpClient();
         string url = $"https://api.github.com/repos/{repo}/releases/tags/{tag}";
-        string json = await http.GetStringAsync(url);
+        string json = await s_http.GetStringAsync(url);
         var doc = JsonDocument.Parse(json);
 
         var result = new List<ReleaseAsset>();
@@ -301,11 +311,10 @@ public class InstallCommand : AsyncCommand<InstallSettings>
 
     private static async Task<bool> DownloadAndExtractZipAsync(string url, string targetDir)
     {
-        using var http = CreateHttpClient();
         string tempFile = Path.Combine(Path.GetTempPath(), $"cosmos-{Guid.NewGuid():N}.zip");
         try
         {
-            await File.WriteAllBytesAsync(tempFile, await http.GetByteArrayAsync(url));
+            await DownloadToFileAsync(url, tempFile);
             ZipFile.ExtractToDirectory(tempFile, targetDir, overwriteFiles: true);
             return true;
         }
@@ -320,11 +329,10 @@ public class InstallCommand : AsyncCommand<InstallSettings>
 
     private static async Task<bool> DownloadAndExtractTarGzAsync(string url, string targetDir)
     {
-        using var http = CreateHttpClient();
         string tempFile = Path.Combine(Path.GetTempPath(), $"cosmos-{Guid.NewGuid():N}.tar.gz");
         try
         {
-            await File.WriteAllBytesAsync(tempFile, await http.GetByteArrayAsync(url));
+            await DownloadToFileAsync(url, tempFile);
 
             using var proc = Process.Start(new ProcessStartInfo
             {
@@ -351,14 +359,42 @@ public class InstallCommand : AsyncCommand<InstallSettings>
         }
     }
 
+    // Streams the response body straight to disk as it arrives instead of
+    // buffering the whole archive in memory first (release archives run to
+    // hundreds of MB); disk writes overlap with the network transfer. The body
+    // lands in a temp file next to path and is moved into place only once
+    // complete, so a failed or cancelled download never leaves a truncated
+    // file behind under the final name.
+    private static async Task DownloadToFileAsync(string url, string path)
+    {
+        using var timeout = new CancellationTokenSource(s_downloadTimeout);
+        string tempPath = $"{path}.{Guid.NewGuid():N}.tmp";
+        try
+        {
+            using (var response = await s_http.GetAsync(url, HttpCompletionOption.ResponseHeadersRead, timeout.Token))
+            {
+                response.EnsureSuccessStatusCode();
+                await using var source = await response.Content.ReadAsStreamAsync(timeout.Token);
+                await using var target = new FileStream(tempPath, FileMode.CreateNew, FileAccess.Write, FileShare.None,
+                    bufferSize: 1, FileOptions.Asynchronous | FileOptions.SequentialScan);
+                await source.CopyToAsync(target, timeout.Token);
+            }
+            File.Move(tempPath, path, overwrite: true);
+        }
+        catch
+        {
+            File.Delete(tempPath);
+            throw;
+        }
+    }
+
     // ═══════════════════════════════════════════════════════════════════════
     //  VS Code extension
     // ═══════════════════════════════════════════════════════════════════════
 
     private static async Task<(string? url, string? name)> GetVSCodeExtensionInfoAsync()
     {
-        using var http = CreateHttpClient();
-        string json = await http.GetStringAsync(
+        string json = await s_http.GetStringAsync(
             "https://api.github.com/repos/valentinbreiz/CosmosVsCodeExtension/releases/latest");
         var release = JsonDocument.Parse(json);
 
@@ -387,8 +423,7 @@ public class InstallCommand : AsyncCommand<InstallSettings>
         }
         Directory.CreateDirectory(destDir);
         string path = Path.Combine(destDir, name);
-        using var http = CreateHttpClient();
-        await File.WriteAllBytesAsync(path, await http.GetByteArrayAsync(url));
+        await DownloadToFileAsync(url, path);
         return path;
     }
 
@@ -616,7 +651,13 @@ public class InstallCommand : AsyncCommand<InstallSettings>
 
     private static HttpClient CreateHttpClient()
     {
-        var http = new HttpClient();
+        var http = new HttpClient
+        {
+            // HTTP/2 where the server offers it (api.github.com and the release
+            // asset CDN do), HTTP/1.1 otherwise.
+            DefaultRequestVersion = HttpVersion.Version20,
+            DefaultVersionPolicy = HttpVersionPolicy.RequestVersionOrLower
+        };
         http.DefaultRequestHeaders.Add("User-Agent", "Cosmos-Tools");
         string? token = GetGitHubToken();
         if (!string.IsNullOrEmpty(token))
@@ -27,8 +27,19 @@ public static class ToolResolver
     /// Timeout for spawned tool subprocesses (e.g. version probes).
     /// </summary>
     private const int CommandTimeoutMs = 5000;
+    /// <summary>
+    /// Extensions `where` tries when PATHEXT is unset.
+    /// </summary>
+    private const string DefaultPathExt = ".COM;.EXE;.BAT;.CMD";
     private static readonly ConcurrentDictionary<string, ResolvedTool> s_cache = new();
 
+    /// <summary>
+    /// File names of each PATH directory, listed once and shared by every lookup,
+    /// so resolving several tools (each with several command aliases) scans PATH
+    /// once instead of spawning `where`/`which` per candidate.
+    /// </summary>
+    private static readonly ConcurrentDictionary<string, HashSet<string>> s_pathDirCache = new();
+
     public static Task<ResolvedTool> ResolveAsync(CommandToolDefinition tool, string? overridePath = null)
     {
         string cacheKey = $"{tool.Name}|{overridePath ?? string.Empty}";
@@ -48,6 +59,7 @@ public static class ToolResolver
     public static void InvalidateCache()
     {
         s_cache.Clear();
+        s_pathDirCache.Clear();
     }
 
     private static async Task<ResolvedTool> ResolveUncachedAsync(
@@ -79,7 +91,7 @@ public static class ToolResolver
         string? pinnedVersion = ReadBundleVersion(tool);
         foreach (string command in tool.GetCommands(PlatformInfo.CurrentOS))
         {
-            string? systemPath = await FindOnPathAsync(command);
+            string? systemPath = FindOnPath(command);
             if (systemPath is null)
             {
                 continue;
@@ -191,16 +203,96 @@ public static class ToolResolver
         return null;
     }
 
-    private static async Task<string?> FindOnPathAsync(string command)
+    /// <summary>
+    /// In-process equivalent of `where` (Windows) / `which` (Unix): the first PATH
+    /// directory holding the command wins. On Windows the command is also tried
+    /// with each PATHEXT extension; on Unix the match must be executable.
+    /// </summary>
+    internal static string? FindOnPath(string command)
     {
-        string finder = PlatformInfo.CurrentOS == OSPlatform.Windows ? "where" : "which";
-        var (success, output) = await RunCommandAsync(finder, command);
-        if (!success)
+        return FindOnPath(command,
+            Environment.GetEnvironmentVariable("PATH"),
+            PlatformInfo.CurrentOS == OSPlatform.Windows,
+            Environment.GetEnvironmentVariable("PATHEXT"));
+    }
+
+    internal static string? FindOnPath(string command, string? pathVar, bool isWindows, string? pathExt)
+    {
+        if (string.IsNullOrEmpty(pathVar))
         {
             return null;
         }
-        string candidate = output.Split('\n', '\r')[0].Trim();
-        return File.Exists(candidate) ? candidate : null;
+
+        List<string> names = new() { command };
+        if (isWindows)
+        {
+            foreach (string ext in (pathExt ?? DefaultPathExt).Split(';', StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries))
+            {
+                names.Add(command + ext);
+            }
+            // `where clang` resolves clang.exe, not an extensionless file named clang.
+            if (!Path.HasExtension(command))
+            {
+                names.RemoveAt(0);
+            }
+        }
+
+        foreach (string entry in pathVar.Split(Path.PathSeparator, StringSplitOptions.RemoveEmptyEntries | StringSplitOptions.TrimEntries))
+        {
+            // Windows PATH entries may be quoted (e.g. "C:\Program Files\LLVM\bin").
+            string dir = entry.Trim('"');
+            if (dir.Length == 0)
+            {
+                continue;
+            }
+
+            HashSet<string> entries = s_pathDirCache.GetOrAdd(dir, ListPathDirectory, isWindows);
+            foreach (string name in names)
+            {
+                if (entries.TryGetValue(name, out string? actualName))
+                {
+                    string candidate = Path.Combine(dir, actualName);
+                    // A non-executable hit doesn't end the search, as with `which`.
+                    if (isWindows || IsExecutable(candidate))
+                    {
+                        return candidate;
+                    }
+                }
+            }
+        }
+        return null;
+    }
+
+    internal static HashSet<string> ListPathDirectory(string dir, bool ignoreCase)
+    {
+        StringComparer comparer = ignoreCase ? StringComparer.OrdinalIgnoreCase : StringComparer.Ordinal;
+        try
+        {
+            return new HashSet<string>(new DirectoryInfo(dir).EnumerateFiles().Select(f => f.Name), comparer);
+        }
+        catch (Exception ex) when (ex is IOException or UnauthorizedAccessException or ArgumentException)
+        {
+            // Missing or unreadable PATH entries are skipped, as `where`/`which` do.
+            return new HashSet<string>(comparer);
+        }
+    }
+
+    internal static bool IsExecutable(string path)
+    {
+        if (OperatingSystem.IsWindows())
+        {
+            // No execute bit; PATHEXT already limited the match to runnable types.
+            return true;
+        }
+        try
+        {
+            const UnixFileMode anyExecute = UnixFileMode.UserExecute | UnixFileMode.GroupExecute | UnixFileMode.OtherExecute;
+            return (File.GetUnixFileMode(path) & anyExecute) != 0;
+        }
+        catch
+        {
+            return false;
+        }
     }
 
     private static async Task<string?> TryGetVersionAsync(string command, string? versionArg)
@@ -102,6 +102,13 @@ public partial class Engine
             // Notify start
             _outputHandler.OnTestSuiteStart(suiteName, _config.Architecture);
 
+            // Boot logs are appended to the combined log as they come in; drop
+            // the previous run's file first so the two never mix.
+            if (!string.IsNullOrEmpty(_config.CombinedUartLogPath))
+            {
+                File.Delete(_config.CombinedUartLogPath);
+            }
+
             // Step 1: Build kernel to ISO
             Console.WriteLine("[Engine] Building kernel...");
             string isoPath = await BuildKernelAsync();
@@ -123,6 +130,10 @@ public partial class Engine
                 Architecture = _config.Architecture
             };
 
+            // Profile logs can run to megabytes each; collect them and build the
+            // aggregate once instead of re-copying it on every profile.
+            var profileUartLogs = new List<string>(profiles.Count);
+
             for (int p = 0; p < profiles.Count; p++)
             {
                 TestProfile profile = profiles[p];
@@ -131,15 +142,22 @@ public partial class Engine
                     Console.WriteLine($"[Engine] === Profile {p + 1}/{profiles.Count}: {profile.Name} ===");
                 }
 
+                // Results are decoded while QEMU runs; every boot of the
+                // profile feeds the same decoder.
+                var decoder = new UartMessageDecoder(_config.Architecture);
+
                 Console.WriteLine("[Engine] Launching QEMU...");
-                QemuRunResult qemuResult = await LaunchAndMonitorAsync(isoPath, profile);
+                QemuRunResult qemuResult = await LaunchAndMonitorAsync(isoPath, profile, decoder);
                 Console.WriteLine($"[Engine] QEMU execution complete (Exit: {qemuResult.ExitCode}, TimedOut: {qemuResult.TimedOut})");
 
                 Console.WriteLine("[Engine] Parsing test results...");
-                TestResults profileResults = ParseResults(qemuResult);
+                TestResults profileResults = ParseResults(qemuResult, decoder);
                 MergeProfileResults(results, profileResults, profile);
+                profileUartLogs.Add(profileResults.UartLog);
             }
 
+            results.UartLog = string.Concat(profileUartLogs);
+
             results.TotalDuration = stopwatch.Elapsed;
 
             Console.WriteLine($"[Engine] Results: {results.PassedTests}/{results.TotalTests} passed");
@@ -201,7 +219,7 @@ public partial class Engine
         }
     }
 
-    private async Task<QemuRunResult> LaunchAndMonitorAsync(string isoPath, TestProfile profile)
+    private async Task<QemuRunResult> LaunchAndMonitorAsync(string isoPath, TestProfile profile, UartMessageDecoder decoder)
     {
         // Setup UART log path. When several profiles run back-to-back, each
         // gets its own log file so a failure in one doesn't lose the other's
@@ -247,11 +265,16 @@ public partial class Engine
 
                 QemuRunResult result = await _qemuHost.RunKernelAsync(
                     bootIsoPath, bootLogPath, _config.TimeoutSeconds, _config.ShouldShowDisplay, enableNetworkTesting, disks, profile.MachineOptions,
-                    new ProfileDevices(profile.NetworkCard, profile.KeyboardDevice, profile.MouseDevice, profile.VgaAdapter));
+                    new ProfileDevices(profile.NetworkCard, profile.KeyboardDevice, profile.MouseDevice, profile.VgaAdapter), decoder);
 
                 combinedLog.Append(result.UartLog);
                 lastResult = result;
 
+                if (!string.IsNullOrEmpty(_config.CombinedUartLogPath) && !string.IsNullOrEmpty(result.UartLog))
+                {
+                    await File.AppendAllTextAsync(_config.CombinedUartLogPath, result.UartLog);
+                }
+
                 // Suite finished cleanly (kernel emitted the end marker).
                 if (result.SuiteMarkerSeen)
                 {
@@ -305,10 +328,7 @@ public partial class Engine
         {
             try
             {
-                if (File.Exists(disk.Path))
-                {
-                    File.Delete(disk.Path);
-                }
+                File.Delete(disk.Path);
             }
             catch (Exception ex)
             {
@@ -336,10 +356,7 @@ public partial class Engine
                 Path.GetTempPath(),
                 $"cosmos-test-disk-{suite}-{_config.Architecture}-{profileTag}-{kindTag}{i}.img");
 
-            if (File.Exists(path))
-            {
-                File.Delete(path);
-            }
+            // FileMode.Create truncates a leftover image, so no Exists/Delete first.
             using (var fs = new FileStream(path, FileMode.Create, FileAccess.Write))
             {
                 fs.SetLength(TestDiskSizeBytes);
@@ -396,7 +413,6 @@ public partial class Engine
         }
 
         aggregate.ExpectedTestCount += profileResults.ExpectedTestCount;
-        aggregate.UartLog += profileResults.UartLog;
         aggregate.CoverageHitMethodIds.AddRange(profileResults.CoverageHitMethodIds);
 
         if (profileResults.TimedOut)
@@ -417,6 +433,17 @@ public partial class Engine
             : aggregate.SuiteCompleted && profileResults.SuiteCompleted;
     }
 
+    // Magic 0x19740807 little-endian = bytes 07 08 74 19, then command byte.
+    // Command 108 = TestDestructiveReached (emitted only by RunDestructive).
+    private static readonly string DestructiveReachedNeedle = Encoding.Latin1.GetString(new byte[]
+    {
+        Consts.SerialSignatureByte0,
+        Consts.SerialSignatureByte1,
+        Consts.SerialSignatureByte2,
+        Consts.SerialSignatureByte3,
+        Ds2Vs.TestDestructiveReached
+    });
+
     /// <summary>
     /// Returns true if the per-boot UART log contains at least one
     /// TestDestructiveReached frame from the binary protocol (magic 0x19740807
@@ -431,23 +458,9 @@ public partial class Engine
         {
             return false;
         }
-        // Magic 0x19740807 little-endian = bytes 07 08 74 19, then command byte.
-        // Command 108 = TestDestructiveReached (emitted only by RunDestructive).
-        byte[] needle = { Consts.SerialSignatureByte0, Consts.SerialSignatureByte1, Consts.SerialSignatureByte2, Consts.SerialSignatureByte3, Ds2Vs.TestDestructiveReached };
-        byte[] haystack = System.Text.Encoding.Latin1.GetBytes(uartLog);
-        for (int i = 0; i + needle.Length <= haystack.Length; i++)
-        {
-            bool match = true;
-            for (int j = 0; j < needle.Length; j++)
-            {
-                if (haystack[i + j] != needle[j]) { match = false; break; }
-            }
-            if (match)
-            {
-                return true;
-            }
-        }
-        return false;
+        // The log is Latin1-decoded, so each char is one UART byte: an ordinal
+        // span search finds the frame without re-encoding the whole log.
+        return uartLog.AsSpan().IndexOf(DestructiveReachedNeedle, StringComparison.Ordinal) >= 0;
     }
 
     /// <summary>
@@ -541,10 +554,10 @@ public partial class Engine
         return bootIsoPath;
     }
 
-    private TestResults ParseResults(QemuRunResult qemuResult)
+    private TestResults ParseResults(QemuRunResult qemuResult, UartMessageDecoder decoder)
     {
-        // Always try to parse UART log, even on timeout - kernel may have completed tests
-        var results = UartMessageParser.ParseUartLog(qemuResult.UartLog ?? string.Empty, _config.Architecture);
+        // Always use the decoded UART log, even on timeout - kernel may have completed tests
+        var results = decoder.Complete();
         results.TimedOut = qemuResult.TimedOut;
         results.UartLog = qemuResult.UartLog ?? string.Empty;
         results.ErrorMessage = qemuResult.ErrorMessage ?? string.Empty;
@@ -2,10 +2,9 @@ using System;
 using System.Collections.Generic;
 using System.Diagnostics;
 using System.IO;
-using System.Text;
 using System.Threading;
 using System.Threading.Tasks;
-using Cosmos.TestRunner.Protocol;
+using Cosmos.TestRunner.Engine.Protocol;
 using Cosmos.Tools.Launcher;
 
 namespace Cosmos.TestRunner.Engine.Hosts;
@@ -16,24 +15,6 @@ namespace Cosmos.TestRunner.Engine.Hosts;
 /// </summary>
 public class QemuARM64Host : IQemuHost
 {
-    // Suite-end marker the kernel emits once the whole suite finished:
-    // 0xDE 0xAD 0xBE 0xEF 0xCA 0xFE 0xBA 0xBE.
-    private static readonly byte[] TestEndMarker = Consts.SuiteEndMarker;
-
-    // Test runner protocol needle: 0x19740807 magic little-endian + command
-    // byte (Ds2Vs.TestPass). Used to detect "kernel reached at least one test"
-    // so we can declare a stall when UART goes silent — handles destructive
-    // ops (e.g. Power.Shutdown's LAI panic) that hang instead of cleanly
-    // exiting QEMU.
-    private static readonly byte[] TestPassMarker =
-    {
-        Consts.SerialSignatureByte0,
-        Consts.SerialSignatureByte1,
-        Consts.SerialSignatureByte2,
-        Consts.SerialSignatureByte3,
-        Ds2Vs.TestPass
-    };
-
     public string Architecture => "arm64";
 
     private readonly string? _qemuBinaryOverride;
@@ -49,7 +30,7 @@ public class QemuARM64Host : IQemuHost
         // uefiFirmwarePath ignored — QemuLauncher.ResolveArm64Firmware() handles it.
     }
 
-    public async Task<QemuRunResult> RunKernelAsync(string isoPath, string uartLogPath, int timeoutSeconds = QemuHostDefaults.DefaultTimeoutSeconds, bool showDisplay = false, bool enableNetworkTesting = false, IReadOnlyList<DiskAttachment>? disks = null, IReadOnlyDictionary<string, string>? machineOptions = null, ProfileDevices? devices = null)
+    public async Task<QemuRunResult> RunKernelAsync(string isoPath, string uartLogPath, int timeoutSeconds = QemuHostDefaults.DefaultTimeoutSeconds, bool showDisplay = false, bool enableNetworkTesting = false, IReadOnlyList<DiskAttachment>? disks = null, IReadOnlyDictionary<string, string>? machineOptions = null, ProfileDevices? devices = null, UartMessageDecoder? decoder = null)
     {
         if (!File.Exists(isoPath))
         {
@@ -60,18 +41,15 @@ public class QemuARM64Host : IQemuHost
             };
         }
 
-        // Ensure UART log directory exists
+        // Ensure UART log directory exists and drop the previous log. Both calls
+        // are no-ops when there is nothing to do, so skip the Exists probes —
+        // an extra stat per path on every boot.
         var logDir = Path.GetDirectoryName(uartLogPath);
-        if (!string.IsNullOrEmpty(logDir) && !Directory.Exists(logDir))
+        if (!string.IsNullOrEmpty(logDir))
         {
             Directory.CreateDirectory(logDir);
         }
-
-        // Delete existing UART log
-        if (File.Exists(uartLogPath))
-        {
-            File.Delete(uartLogPath);
-        }
+        File.Delete(uartLogPath);
 
         QemuLaunchPlan plan;
         try
@@ -105,6 +83,7 @@ public class QemuARM64Host : IQemuHost
 
         using var process = new Process { StartInfo = startInfo };
         using var cts = new CancellationTokenSource(TimeSpan.FromSeconds(timeoutSeconds));
+        using var monitor = new UartLogMonitor(uartLogPath, decoder);
 
         // Only create test servers for network tests
         UdpTestServer? udpServer = null;
@@ -130,12 +109,16 @@ public class QemuARM64Host : IQemuHost
 
             process.Start();
 
-            // Capture stderr asynchronously for diagnostics
+            // Drain stdout and stderr asynchronously. The serial console goes
+            // to the log file, but QEMU still prints warnings and monitor
+            // chatter, and an unread redirected pipe fills up and blocks QEMU
+            // mid-run — which then surfaces as a bogus timeout.
+            var stdoutTask = process.StandardOutput.ReadToEndAsync();
             var stderrTask = process.StandardError.ReadToEndAsync();
 
             // Monitor UART log for the suite-end marker or a stall after a test
             // was reached, while waiting for QEMU to exit on its own.
-            var monitorTask = MonitorUartLogAsync(uartLogPath, cts.Token);
+            var monitorTask = monitor.RunAsync(cts.Token);
             var processTask = process.WaitForExitAsync(cts.Token);
 
             var completedTask = await Task.WhenAny(monitorTask, processTask);
@@ -144,9 +127,23 @@ public class QemuARM64Host : IQemuHost
             {
                 UartMonitorOutcome outcome = await monitorTask;
                 testSuiteCompleted = outcome == UartMonitorOutcome.EndMarkerSeen;
+                // Trailing UART bytes get up to the grace period to land, but a
+                // QEMU that exits on its own (kernel powered off after the
+                // suite) ends the wait right away instead of sitting it out.
+                using (var grace = new CancellationTokenSource(QemuHostDefaults.KillGraceDelayMs))
+                {
+                    try
+                    {
+                        await process.WaitForExitAsync(grace.Token);
+                    }
+                    catch (OperationCanceledException)
+                    {
+                        // Still running after the grace period
+                    }
+                }
+
                 if (!process.HasExited)
                 {
-                    await Task.Delay(QemuHostDefaults.KillGraceDelayMs);
                     process.Kill(entireProcessTree: true);
                     await process.WaitForExitAsync();
                 }
@@ -157,8 +154,8 @@ public class QemuARM64Host : IQemuHost
                 await processTask;
             }
 
-            // Give UART log a moment to flush
-            await Task.Delay(QemuHostDefaults.UartFlushDelayMs);
+            // QEMU has exited here, so every byte its serial chardev wrote is
+            // already in the log file; there is nothing left to wait for.
 
             // Stop test servers if running
             if (udpServer != null)
@@ -176,19 +173,21 @@ public class QemuARM64Host : IQemuHost
                 await icmpServer.StopAsync();
             }
 
-            // Log stderr for diagnostics
+            // Log stdout/stderr for diagnostics
+            string stdout = await stdoutTask;
+            if (!string.IsNullOrWhiteSpace(stdout))
+            {
+                Console.WriteLine($"[QEMU stdout] {stdout.Trim()}");
+            }
+
             string stderr = await stderrTask;
             if (!string.IsNullOrWhiteSpace(stderr))
             {
                 Console.WriteLine($"[QEMU stderr] {stderr.Trim()}");
             }
 
-            // Read UART log
-            string uartLog = string.Empty;
-            if (File.Exists(uartLogPath))
-            {
-                uartLog = await File.ReadAllTextAsync(uartLogPath, Encoding.Latin1);
-            }
+            // Read UART log; the decoder gets whatever the monitor hadn't reached
+            string uartLog = await monitor.StopAndReadLogAsync();
 
             return new QemuRunResult
             {
@@ -207,9 +206,6 @@ public class QemuARM64Host : IQemuHost
                 await process.WaitForExitAsync();
             }
 
-            // Give UART log a moment to flush
-            await Task.Delay(QemuHostDefaults.UartFlushDelayMs);
-
             // Stop test servers if running
             if (udpServer != null)
             {
@@ -227,11 +223,7 @@ public class QemuARM64Host : IQemuHost
             }
 
             // Read whatever UART output we got
-            string uartLog = string.Empty;
-            if (File.Exists(uartLogPath))
-            {
-                uartLog = await File.ReadAllTextAsync(uartLogPath, Encoding.Latin1);
-            }
+            string uartLog = await monitor.StopAndReadLogAsync();
 
             return new QemuRunResult
             {
@@ -266,87 +258,4 @@ public class QemuARM64Host : IQemuHost
             };
         }
     }
-
-    /// <summary>
-    /// Monitor UART log for the suite-end marker or a stall after a test was
-    /// reached. See <see cref="QemuX64Host"/> for the full rationale.
-    /// </summary>
-    private static async Task<UartMonitorOutcome> MonitorUartLogAsync(string uartLogPath, CancellationToken cancellationToken)
-    {
-        long lastPosition = 0;
-        int endMarkerIndex = 0;
-        int testPassMarkerIndex = 0;
-        bool sawTestPass = false;
-        // See QemuX64Host for the rationale: track the last protocol-frame
-        // magic, not raw UART bytes — a hung kernel keeps spamming scheduler
-        // text but stops emitting protocol frames.
-        DateTime lastMagicAt = DateTime.UtcNow;
-
-        while (!cancellationToken.IsCancellationRequested)
-        {
-            try
-            {
-                if (File.Exists(uartLogPath))
-                {
-                    using var fs = new FileStream(uartLogPath, FileMode.Open, FileAccess.Read, FileShare.ReadWrite);
-                    if (fs.Length > lastPosition)
-                    {
-                        fs.Seek(lastPosition, SeekOrigin.Begin);
-                        var buffer = new byte[fs.Length - lastPosition];
-                        int bytesRead = await fs.ReadAsync(buffer, cancellationToken);
-                        lastPosition += bytesRead;
-
-                        for (int i = 0; i < bytesRead; i++)
-                        {
-                            byte b = buffer[i];
-
-                            if (b == TestEndMarker[endMarkerIndex])
-                            {
-                                endMarkerIndex++;
-                                if (endMarkerIndex == TestEndMarker.Length)
-                                {
-                                    return UartMonitorOutcome.EndMarkerSeen;
-                                }
-                            }
-                            else
-                            {
-                                endMarkerIndex = (b == TestEndMarker[0]) ? 1 : 0;
-                            }
-
-                            if (b == TestPassMarker[testPassMarkerIndex])
-                            {
-                                testPassMarkerIndex++;
-                                if (testPassMarkerIndex == Consts.SerialSignatureLengthBytes)
-                                {
-                                    lastMagicAt = DateTime.UtcNow;
-                                }
-                                if (testPassMarkerIndex == TestPassMarker.Length)
-                                {
-                                    sawTestPass = true;
-                                    testPassMarkerIndex = 0;
-                                }
-                            }
-                            else
-                            {
-                                testPassMarkerIndex = (b == TestPassMarker[0]) ? 1 : 0;
-                            }
-                        }
-                    }
-
-                    if (sawTestPass && (DateTime.UtcNow - lastMagicAt).TotalSeconds >= QemuHostDefaults.StallSecondsAfterTestPass)
-                    {
-                        return UartMonitorOutcome.Stalled;
-                    }
-                }
-            }
-            catch (IOException)
-            {
-                // File might be locked, try again
-            }
-
-            await Task.Delay(QemuHostDefaults.UartPollIntervalMs, cancellationToken);
-        }
-
-        return UartMonitorOutcome.NotFinished;
-    }
 }
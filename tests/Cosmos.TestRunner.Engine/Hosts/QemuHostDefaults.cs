@@ -14,15 +14,15 @@ internal static class QemuHostDefaults
     /// <summary>Default QEMU guest memory size in megabytes.</summary>
     internal const int DefaultMemoryMb = 512;
 
-    /// <summary>Grace delay before killing QEMU once the UART monitor finished, in milliseconds — lets trailing UART bytes land.</summary>
+    /// <summary>Longest wait for QEMU to exit on its own once the UART monitor finished before killing it, in milliseconds — lets trailing UART bytes land.</summary>
     internal const int KillGraceDelayMs = 200;
 
-    /// <summary>Delay after QEMU exits to let the UART log flush to disk, in milliseconds.</summary>
-    internal const int UartFlushDelayMs = 100;
-
-    /// <summary>Polling interval of the UART log monitor loop, in milliseconds.</summary>
+    /// <summary>Longest the UART log monitor waits between drains, in milliseconds — it wakes earlier on a file-change notification.</summary>
     internal const int UartPollIntervalMs = 100;
 
+    /// <summary>Size of each read the UART log monitor drains the log with, in bytes.</summary>
+    internal const int UartReadChunkBytes = 64 * 1024;
+
     /// <summary>
     /// Seconds of UART quiet (no protocol-frame magic) after a TestPass before
     /// the UART monitor declares the kernel stalled — handles destructive ops
@@ -0,0 +1,317 @@
+using System;
+using System.IO;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+using Cosmos.TestRunner.Engine.Protocol;
+using Cosmos.TestRunner.Protocol;
+using Microsoft.Win32.SafeHandles;
+
+namespace Cosmos.TestRunner.Engine.Hosts;
+
+/// <summary>
+/// Tails the UART log QEMU writes through its <c>-serial file:</c> chardev and
+/// decides when a run is over. Shared by <see cref="QemuX64Host"/> and
+/// <see cref="QemuARM64Host"/>; one instance monitors one boot. Every byte
+/// read is also fed to an optional <see cref="UartMessageDecoder"/>, so test
+/// results build up while the kernel is still running.
+/// </summary>
+internal sealed class UartLogMonitor : IDisposable
+{
+    // Suite-end marker the kernel emits once the whole suite finished:
+    // 0xDE 0xAD 0xBE 0xEF 0xCA 0xFE 0xBA 0xBE.
+    private static readonly byte[] TestEndMarker = Consts.SuiteEndMarker;
+
+    // Test runner protocol needle: 0x19740807 magic little-endian + command
+    // byte (Ds2Vs.TestPass). Used to detect "kernel reached at least one test"
+    // so we can declare a stall when UART goes silent — handles destructive
+    // ops (e.g. Power.Shutdown's LAI panic) that hang instead of cleanly
+    // exiting QEMU.
+    private static readonly byte[] TestPassMarker =
+    {
+        Consts.SerialSignatureByte0,
+        Consts.SerialSignatureByte1,
+        Consts.SerialSignatureByte2,
+        Consts.SerialSignatureByte3,
+        Ds2Vs.TestPass
+    };
+
+    /// <summary>Bytes of the previous chunk kept in front of the next one so a suite-end marker split across two reads still matches.</summary>
+    private static readonly int EndMarkerCarryBytes = TestEndMarker.Length - 1;
+
+    private readonly string _uartLogPath;
+    private readonly UartMessageDecoder? _decoder;
+    private readonly CancellationTokenSource _stop = new();
+
+    // Released by the file watcher when QEMU writes to the log; the monitor
+    // waits on it between drains instead of sleeping a full poll interval.
+    // Capacity 1: a burst of notifications coalesces into one wake-up.
+    private readonly SemaphoreSlim _logChanged = new(0, 1);
+    private CancellationTokenSource? _linked;
+    private Task<UartMonitorOutcome>? _run;
+
+    // Bytes of the log consumed (and fed to the decoder) so far
+    private long _position;
+
+    // Layout: [carry: up to EndMarkerCarryBytes][chunk: UartReadChunkBytes].
+    // Reads land right after the carried tail, so the end-marker search runs
+    // over one contiguous window without copying the chunk.
+    private readonly byte[] _buffer = new byte[EndMarkerCarryBytes + QemuHostDefaults.UartReadChunkBytes];
+    private int _carried;
+
+    private bool _sawTestPass;
+
+    // Track time of the last protocol-frame magic — not just any UART byte.
+    // After Power.Shutdown's LAI panic the scheduler keeps writing text to
+    // UART, so a "no growth" check would never fire; "no protocol magic"
+    // does, since the test framework emits no more frames once hung.
+    private DateTime _lastMagicAt = DateTime.UtcNow;
+
+    public UartLogMonitor(string uartLogPath, UartMessageDecoder? decoder = null)
+    {
+        _uartLogPath = uartLogPath;
+        _decoder = decoder;
+    }
+
+    /// <summary>Bytes of the log consumed so far.</summary>
+    internal long Position => Interlocked.Read(ref _position);
+
+    /// <summary>Whether a TestPass frame has been seen.</summary>
+    internal bool SawTestPass => _sawTestPass;
+
+    /// <summary>When the last protocol-frame magic was seen (construction time if none yet).</summary>
+    internal DateTime LastMagicAt => _lastMagicAt;
+
+    /// <summary>
+    /// Monitor the UART log file for either the suite-end marker or a stall
+    /// after a test was reached. Returns <see cref="UartMonitorOutcome.EndMarkerSeen"/>
+    /// when the kernel cleanly finished, or <see cref="UartMonitorOutcome.Stalled"/>
+    /// when a TestPass was observed and the UART has been quiet for
+    /// <see cref="QemuHostDefaults.StallSecondsAfterTestPass"/> seconds (treated as "destructive
+    /// op fired but didn't exit QEMU"). Returns <see cref="UartMonitorOutcome.NotFinished"/>
+    /// only on cancellation.
+    /// </summary>
+    public Task<UartMonitorOutcome> RunAsync(CancellationToken cancellationToken)
+    {
+        _linked = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken, _stop.Token);
+        _run = MonitorAsync(_linked.Token);
+        return _run;
+    }
+
+    /// <summary>
+    /// Stop monitoring (if still running) and return the whole UART log. The
+    /// bytes the monitor had not reached yet are fed to the decoder here, so
+    /// once this returns the decoder has seen the complete log exactly once.
+    /// </summary>
+    public async Task<string> StopAndReadLogAsync()
+    {
+        if (_run != null)
+        {
+            _stop.Cancel();
+            try
+            {
+                await _run;
+            }
+            catch (OperationCanceledException)
+            {
+                // Expected when the monitor was still polling
+            }
+        }
+
+        if (!File.Exists(_uartLogPath))
+        {
+            return string.Empty;
+        }
+
+        byte[] log = await File.ReadAllBytesAsync(_uartLogPath);
+        _decoder?.Feed(log.AsSpan((int)Math.Min(_position, log.Length)));
+        return Encoding.Latin1.GetString(log);
+    }
+
+    /// <summary>
+    /// Stop the monitor if it is still polling (e.g. the host bailed out
+    /// without reading the log) and release its cancellation sources and
+    /// wake-up semaphore.
+    /// </summary>
+    public void Dispose()
+    {
+        _stop.Cancel();
+        if (_run is { IsCompleted: false })
+        {
+            // The loop is still unwinding from the cancellation; release what
+            // it waits on once it is done instead of from under it.
+            _run.ContinueWith(_ => DisposeWaitSources(), CancellationToken.None,
+                TaskContinuationOptions.ExecuteSynchronously, TaskScheduler.Default);
+            return;
+        }
+
+        DisposeWaitSources();
+    }
+
+    private void DisposeWaitSources()
+    {
+        _linked?.Dispose();
+        _stop.Dispose();
+        _logChanged.Dispose();
+    }
+
+    private async Task<UartMonitorOutcome> MonitorAsync(CancellationToken cancellationToken)
+    {
+        // The log is opened once and drained from where the last poll stopped,
+        // in fixed-size chunks through one reusable buffer — no re-open and no
+        // per-poll allocation sized to whatever QEMU wrote meanwhile. Reads are
+        // positional on the raw handle (pread on Unix): no FileStream position
+        // bookkeeping or seek, the kernel copies straight into _buffer.
+        // Change notifications wake the loop as soon as QEMU writes, so the
+        // suite-end marker is seen within one write instead of up to a poll
+        // interval later. The poll interval stays as the upper bound on the
+        // wait: notifications can be dropped (watch limits, network mounts)
+        // or unavailable, and the stall check has to run on a quiet log too.
+        using FileSystemWatcher? watcher = TryWatchLog();
+        SafeFileHandle? handle = null;
+        try
+        {
+            while (!cancellationToken.IsCancellationRequested)
+            {
+                try
+                {
+                    handle ??= TryOpenLog();
+                    if (handle != null)
+                    {
+                        int bytesRead;
+                        while ((bytesRead = await RandomAccess.ReadAsync(handle, _buffer.AsMemory(_carried, QemuHostDefaults.UartReadChunkBytes), _position, cancellationToken)) > 0)
+                        {
+                            _position += bytesRead;
+                            if (ScanChunk(bytesRead))
+                            {
+                                return UartMonitorOutcome.EndMarkerSeen;
+                            }
+                        }
+
+                        if (_sawTestPass && (DateTime.UtcNow - _lastMagicAt).TotalSeconds >= QemuHostDefaults.StallSecondsAfterTestPass)
+                        {
+                            return UartMonitorOutcome.Stalled;
+                        }
+                    }
+                }
+                catch (IOException)
+                {
+                    // File might be locked, try again
+                }
+
+                await _logChanged.WaitAsync(QemuHostDefaults.UartPollIntervalMs, cancellationToken);
+            }
+        }
+        finally
+        {
+            handle?.Dispose();
+        }
+
+        return UartMonitorOutcome.NotFinished;
+    }
+
+    private SafeFileHandle? TryOpenLog()
+    {
+        if (!File.Exists(_uartLogPath))
+        {
+            return null;
+        }
+
+        return File.OpenHandle(_uartLogPath, FileMode.Open, FileAccess.Read, FileShare.ReadWrite);
+    }
+
+    private FileSystemWatcher? TryWatchLog()
+    {
+        try
+        {
+            string fullPath = Path.GetFullPath(_uartLogPath);
+            FileSystemWatcher watcher = new(Path.GetDirectoryName(fullPath)!, Path.GetFileName(fullPath))
+            {
+                NotifyFilter = NotifyFilters.FileName | NotifyFilters.Size | NotifyFilters.LastWrite
+            };
+            watcher.Created += OnLogChanged;
+            watcher.Changed += OnLogChanged;
+            watcher.EnableRaisingEvents = true;
+            return watcher;
+        }
+        catch (Exception ex) when (ex is IOException or ArgumentException or PlatformNotSupportedException)
+        {
+            // No notifications (e.g. inotify watch limit reached): plain polling
+            return null;
+        }
+    }
+
+    private void OnLogChanged(object sender, FileSystemEventArgs e)
+    {
+        // QEMU's file chardev issues one write() per guest UART byte, so events
+        // arrive in floods; nearly all of them find a wake-up already pending.
+        if (_logChanged.CurrentCount != 0)
+        {
+            return;
+        }
+
+        try
+        {
+            _logChanged.Release();
+        }
+        catch (SemaphoreFullException)
+        {
+            // Another event released it between the check and the call
+        }
+        catch (ObjectDisposedException)
+        {
+            // Event delivered after the monitor was disposed
+        }
+    }
+
+    /// <summary>
+    /// Scan <paramref name="chunk"/> as if it had just been read from the log,
+    /// carry-over included. Lets tests drive the window logic read by read.
+    /// </summary>
+    internal bool ScanChunk(ReadOnlySpan<byte> chunk)
+    {
+        chunk.CopyTo(_buffer.AsSpan(_carried));
+        _position += chunk.Length;
+        return ScanChunk(chunk.Length);
+    }
+
+    /// <summary>
+    /// Scan the <paramref name="bytesRead"/> bytes just read after the carried
+    /// tail. Returns true once the suite-end marker is found.
+    /// </summary>
+    private bool ScanChunk(int bytesRead)
+    {
+        Span<byte> window = _buffer.AsSpan(0, _carried + bytesRead);
+        _decoder?.Feed(window.Slice(_carried));
+
+        if (window.IndexOf(TestEndMarker) >= 0)
+        {
+            return true;
+        }
+
+        // The carried tail was already scanned, so only matches ending in the new
+        // bytes count: start each search just far enough back to catch a
+        // needle split across the two reads.
+        ReadOnlySpan<byte> magic = TestPassMarker.AsSpan(0, Consts.SerialSignatureLengthBytes);
+        if (NewMatchRegion(window, magic.Length).IndexOf(magic) >= 0)
+        {
+            // Full magic 0x19740807 hit — kernel emitted a frame.
+            _lastMagicAt = DateTime.UtcNow;
+        }
+        if (!_sawTestPass && NewMatchRegion(window, TestPassMarker.Length).IndexOf(TestPassMarker) >= 0)
+        {
+            _sawTestPass = true;
+        }
+
+        // Keep the tail for the next chunk; CopyTo handles the overlap.
+        int keep = Math.Min(EndMarkerCarryBytes, window.Length);
+        window.Slice(window.Length - keep).CopyTo(_buffer);
+        _carried = keep;
+        return false;
+    }
+
+    private ReadOnlySpan<byte> NewMatchRegion(ReadOnlySpan<byte> window, int needleLength)
+    {
+        return window.Slice(Math.Max(0, _carried - (needleLength - 1)));
+    }
+}
@@ -1,4 +1,5 @@
 using System;
+using System.Buffers;
 using System.IO;
 using System.Text;
 using System.Xml;
@@ -28,6 +29,9 @@ public class OutputHandlerXml : OutputHandlerBase
     /// <summary>Upper bound (#xFFFD) of the second valid XML 1.0 character range [#xE000-#xFFFD].</summary>
     private const int XmlPrivateUseRangeEnd = 0xFFFD;
 
+    /// <summary>Every char the XML 1.0 Char production rejects, for vectorized searches over whole UART logs.</summary>
+    private static readonly SearchValues<char> InvalidXmlChars = SearchValues.Create(BuildInvalidXmlChars());
+
     private readonly string _outputPath;
     private readonly StringBuilder _xmlBuilder;
     private string _suiteName = string.Empty;
@@ -218,18 +222,41 @@ public class OutputHandlerXml : OutputHandlerBase
             return text;
         }
 
+        // Jump from one invalid char to the next and copy the valid runs in
+        // between, instead of testing and appending char by char. A clean
+        // string (the common case) is returned without any copy.
+        ReadOnlySpan<char> remaining = text;
+        int invalid = remaining.IndexOfAny(InvalidXmlChars);
+        if (invalid < 0)
+        {
+            return text;
+        }
+
         var filtered = new StringBuilder(text.Length);
-        foreach (char c in text)
+        while (invalid >= 0)
+        {
+            filtered.Append(remaining.Slice(0, invalid));
+            remaining = remaining.Slice(invalid + 1);
+            invalid = remaining.IndexOfAny(InvalidXmlChars);
+        }
+        filtered.Append(remaining);
+        return filtered.ToString();
+    }
+
+    private static string BuildInvalidXmlChars()
+    {
+        var invalid = new StringBuilder();
+        for (int c = char.MinValue; c <= char.MaxValue; c++)
         {
             // Allow: tab (0x09), newline (0x0A), carriage return (0x0D), and standard printable characters
-            if (c == XmlTabChar || c == XmlLineFeedChar || c == XmlCarriageReturnChar ||
+            bool valid = c == XmlTabChar || c == XmlLineFeedChar || c == XmlCarriageReturnChar ||
                 (c >= XmlPrintableRangeStart && c <= XmlPrintableRangeEnd) ||
-                (c >= XmlPrivateUseRangeStart && c <= XmlPrivateUseRangeEnd))
+                (c >= XmlPrivateUseRangeStart && c <= XmlPrivateUseRangeEnd);
+            if (!valid)
             {
-                filtered.Append(c);
+                invalid.Append((char)c);
             }
-            // Skip invalid characters
         }
-        return filtered.ToString();
+        return invalid.ToString();
     }
 }
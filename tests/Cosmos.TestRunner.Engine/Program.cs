@@ -7,6 +7,9 @@ namespace Cosmos.TestRunner.Engine;
 
 class Program
 {
+    /// <summary>File the engine appends every boot's UART output to.</summary>
+    private const string UartLogFile = "uart-output.log";
+
     static async Task<int> Main(string[] args)
     {
         Console.WriteLine("Cosmos Test Runner Engine");
@@ -60,7 +63,8 @@ class Program
             KeepBuildArtifacts = true, // Keep artifacts for debugging
             XmlOutputPath = xmlOutput,
             Mode = mode,
-            CoverageEnabled = coverageEnabled
+            CoverageEnabled = coverageEnabled,
+            CombinedUartLogPath = UartLogFile
         };
 
         if (coverageEnabled)
@@ -80,15 +84,11 @@ class Program
         {
             var results = await engine.ExecuteAsync();
 
-            // Output handlers have already displayed results
-            // Just save UART log and return exit code
-
-            // Save UART log
-            if (!string.IsNullOrEmpty(results.UartLog))
+            // Output handlers have already displayed results, and the engine
+            // wrote the UART log boot by boot while it ran; just return the exit code
+            if (File.Exists(UartLogFile))
             {
-                string uartLogFile = "uart-output.log";
-                await File.WriteAllTextAsync(uartLogFile, results.UartLog);
-                Console.WriteLine($"\nUART log saved to: {uartLogFile}");
+                Console.WriteLine($"\nUART log saved to: {UartLogFile}");
             }
 
             return results.AllTestsPassed ? 0 : 1;
@@ -0,0 +1,121 @@
+using System;
+using System.Collections.Generic;
+
+namespace Cosmos.TestRunner.Engine.Protocol;
+
+/// <summary>
+/// Incremental decoder for the binary test protocol. UART bytes are fed in as
+/// they arrive and <see cref="Results"/> is updated frame by frame; only the
+/// bytes of a frame still in flight (plus a partial magic) stay buffered.
+/// Feeding a log in any number of chunks and then calling <see cref="Complete"/>
+/// yields the same results as <see cref="UartMessageParser.ParseUartLog"/> on
+/// the whole log.
+/// </summary>
+public class UartMessageDecoder
+{
+    /// <summary>Initial capacity of the pending-bytes buffer; it grows only while a large frame (e.g. CoverageData) is in flight.</summary>
+    private const int InitialPendingCapacity = 4096;
+
+    /// <summary>Trailing bytes kept when no magic is pending, so a magic split across two chunks still matches.</summary>
+    private static readonly int MagicCarryBytes = UartMessageParser.FrameMagic.Length - 1;
+
+    private byte[] _pending = new byte[InitialPendingCapacity];
+    private int _pendingLength;
+
+    // Index of Results.Tests by test number for the Pass/Fail/Skip lookups
+    private readonly Dictionary<int, TestResult> _testsByNumber = new();
+
+    public UartMessageDecoder(string architecture)
+    {
+        Results = new TestResults { Architecture = architecture };
+    }
+
+    /// <summary>Results decoded so far.</summary>
+    public TestResults Results { get; }
+
+    /// <summary>Number of protocol frames decoded so far.</summary>
+    public int MessagesFound { get; private set; }
+
+    /// <summary>
+    /// Decode every complete frame available after appending <paramref name="chunk"/>.
+    /// </summary>
+    public void Feed(ReadOnlySpan<byte> chunk)
+    {
+        if (chunk.IsEmpty)
+        {
+            return;
+        }
+
+        if (_pendingLength + chunk.Length > _pending.Length)
+        {
+            Array.Resize(ref _pending, Math.Max(_pending.Length * 2, _pendingLength + chunk.Length));
+        }
+
+        chunk.CopyTo(_pending.AsSpan(_pendingLength));
+        _pendingLength += chunk.Length;
+        Decode(endOfStream: false);
+    }
+
+    /// <summary>
+    /// Signal the end of the stream. A frame still waiting for its tail is
+    /// treated as garbage and the bytes behind its magic are rescanned, exactly
+    /// as the one-shot parser does at the end of a log.
+    /// </summary>
+    public TestResults Complete()
+    {
+        Decode(endOfStream: true);
+
+        Console.WriteLine($"[UartParser] Found {MessagesFound} protocol messages");
+        Console.WriteLine($"[UartParser] Suite name: {Results.SuiteName}");
+        Console.WriteLine($"[UartParser] Tests found: {Results.Tests.Count}");
+
+        return Results;
+    }
+
+    private void Decode(bool endOfStream)
+    {
+        ReadOnlySpan<byte> data = _pending.AsSpan(0, _pendingLength);
+
+        // A frame can only start at a magic match, so jump from one candidate
+        // to the next with a vectorized search instead of retrying the parse
+        // at every byte of interleaved text.
+        int offset = data.IndexOf(UartMessageParser.FrameMagic);
+        int consumed = Math.Max(0, data.Length - MagicCarryBytes);
+        while (offset >= 0)
+        {
+            FrameStatus status = UartMessageParser.TryParseMessage(data, ref offset, Results, _testsByNumber);
+            if (status == FrameStatus.Incomplete && !endOfStream)
+            {
+                // Keep the partial frame; the next chunk completes it
+                consumed = offset;
+                break;
+            }
+
+            if (status == FrameStatus.Parsed)
+            {
+                MessagesFound++;
+            }
+            else
+            {
+                // Not a valid frame: resume the search one byte further
+                offset++;
+            }
+
+            int next = data.Slice(offset).IndexOf(UartMessageParser.FrameMagic);
+            if (next < 0)
+            {
+                consumed = Math.Max(offset, data.Length - MagicCarryBytes);
+                break;
+            }
+            offset += next;
+        }
+
+        if (endOfStream)
+        {
+            consumed = data.Length;
+        }
+
+        data.Slice(consumed).CopyTo(_pending);
+        _pendingLength -= consumed;
+    }
+}
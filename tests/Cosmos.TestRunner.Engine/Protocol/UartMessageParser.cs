@@ -1,4 +1,5 @@
 using System;
+using System.Buffers.Binary;
 using System.Collections.Generic;
 using System.Text;
 using Cosmos.TestRunner.Protocol;
@@ -10,20 +11,10 @@ namespace Cosmos.TestRunner.Engine.Protocol;
 /// </summary>
 public class UartMessageParser
 {
-    /// <summary>Offset of the second magic byte within a frame header.</summary>
-    private const int MagicByte1Offset = 1;
-    /// <summary>Offset of the third magic byte within a frame header.</summary>
-    private const int MagicByte2Offset = 2;
-    /// <summary>Offset of the fourth magic byte within a frame header.</summary>
-    private const int MagicByte3Offset = 3;
     /// <summary>Offset of the Command byte within a frame header ([MAGIC:4][Command:1][Length:2]).</summary>
     private const int CommandOffset = 4;
-    /// <summary>Offset of the low byte of the payload Length field within a frame header.</summary>
-    private const int LengthLowOffset = 5;
-    /// <summary>Offset of the high byte of the payload Length field within a frame header.</summary>
-    private const int LengthHighOffset = 6;
-    /// <summary>Bit shift applied to the high Length byte when assembling the little-endian 16-bit payload length.</summary>
-    private const int LengthHighShift = 8;
+    /// <summary>Offset of the little-endian 16-bit payload Length field within a frame header.</summary>
+    private const int LengthOffset = 5;
     /// <summary>Total frame header size in bytes: [MAGIC:4][Command:1][Length:2].</summary>
     private const int HeaderLengthBytes = 7;
 
@@ -48,41 +39,30 @@ public class UartMessageParser
     /// <summary>First printable ASCII character; anything below is a control character (0x00..0x1F).</summary>
     private const int MinPrintableChar = 0x20;
 
+    /// <summary>Frame magic 0x19740807 as it appears little-endian on the wire; the search needle for the next candidate frame.</summary>
+    internal static readonly byte[] FrameMagic =
+    {
+        Consts.SerialSignatureByte0,
+        Consts.SerialSignatureByte1,
+        Consts.SerialSignatureByte2,
+        Consts.SerialSignatureByte3
+    };
+
     /// <summary>
     /// Parse UART log and extract test results
     /// </summary>
     public static TestResults ParseUartLog(string uartLog, string architecture)
     {
-        var results = new TestResults { Architecture = architecture };
-
         // Extract binary data from UART log (filter out ANSI codes and text)
         var binaryData = ExtractBinaryData(uartLog);
 
         Console.WriteLine($"[UartParser] UART log length: {uartLog.Length} bytes");
         Console.WriteLine($"[UartParser] Binary data length: {binaryData.Length} bytes");
 
-        // Parse protocol messages
-        int offset = 0;
-        int messagesFound = 0;
-        while (offset < binaryData.Length)
-        {
-            int oldOffset = offset;
-            if (!TryParseMessage(binaryData, ref offset, results))
-            {
-                // Skip byte if we can't parse a valid message
-                offset++;
-            }
-            else if (offset > oldOffset)
-            {
-                messagesFound++;
-            }
-        }
-
-        Console.WriteLine($"[UartParser] Found {messagesFound} protocol messages");
-        Console.WriteLine($"[UartParser] Suite name: {results.SuiteName}");
-        Console.WriteLine($"[UartParser] Tests found: {results.Tests.Count}");
-
-        return results;
+        // A whole log is just a stream that arrives in one chunk
+        var decoder = new UartMessageDecoder(architecture);
+        decoder.Feed(binaryData);
+        return decoder.Complete();
     }
 
     private static byte[] ExtractBinaryData(string uartLog)
@@ -92,19 +72,26 @@ public class UartMessageParser
         return Encoding.Latin1.GetBytes(uartLog);
     }
 
-    private static bool TryParseMessage(byte[] data, ref int offset, TestResults results)
+    /// <summary>
+    /// Try to parse the frame starting at <paramref name="offset"/> into
+    /// <paramref name="results"/>. On <see cref="FrameStatus.Parsed"/> the offset
+    /// moves past the frame; otherwise it is left untouched.
+    /// <paramref name="testsByNumber"/> indexes <c>results.Tests</c> by test
+    /// number and is kept in step with it, so result frames find their test
+    /// without scanning the list.
+    /// </summary>
+    internal static FrameStatus TryParseMessage(ReadOnlySpan<byte> data, ref int offset, TestResults results, Dictionary<int, TestResult> testsByNumber)
     {
         // Need at least 7 bytes: [MAGIC:4][Command:1][Length:2]
         if (offset + HeaderLengthBytes > data.Length)
         {
-            return false;
+            return FrameStatus.Incomplete;
         }
 
         // Check for magic signature (0x19740807 little-endian)
-        if (data[offset] != Consts.SerialSignatureByte0 || data[offset + MagicByte1Offset] != Consts.SerialSignatureByte1 ||
-            data[offset + MagicByte2Offset] != Consts.SerialSignatureByte2 || data[offset + MagicByte3Offset] != Consts.SerialSignatureByte3)
+        if (BinaryPrimitives.ReadUInt32LittleEndian(data.Slice(offset)) != Consts.SerialSignature)
         {
-            return false;
+            return FrameStatus.Invalid;
         }
 
         byte command = data[offset + CommandOffset];
@@ -112,26 +99,26 @@ public class UartMessageParser
         // Only proceed if this looks like a valid protocol command
         if (command < Ds2Vs.TestSuiteStart || command > Ds2Vs.TestDestructiveReached)
         {
-            return false;
+            return FrameStatus.Invalid;
         }
 
-        ushort length = (ushort)(data[offset + LengthLowOffset] | (data[offset + LengthHighOffset] << LengthHighShift));
+        ushort length = BinaryPrimitives.ReadUInt16LittleEndian(data.Slice(offset + LengthOffset));
 
         // Sanity check: coverage data can be large, other messages should be small
         int maxLength = (command == Ds2Vs.CoverageData) ? MaxCoveragePayloadBytes : MaxStandardPayloadBytes;
         if (length > maxLength)
         {
-            return false;
+            return FrameStatus.Invalid;
         }
 
         // Validate we have enough data for payload
         if (offset + HeaderLengthBytes + length > data.Length)
         {
-            return false;
+            return FrameStatus.Incomplete;
         }
 
-        byte[] payload = new byte[length];
-        Array.Copy(data, offset + HeaderLengthBytes, payload, 0, length);
+        // Payload is a view into the log buffer, not a copy
+        ReadOnlySpan<byte> payload = data.Slice(offset + HeaderLengthBytes, length);
 
         // Only advance offset after we've validated this is a real message
         offset += HeaderLengthBytes + length;
@@ -141,48 +128,48 @@ public class UartMessageParser
         {
             case Ds2Vs.TestSuiteStart:
                 ParseTestSuiteStart(payload, results);
-                return true;
+                return FrameStatus.Parsed;
 
             case Ds2Vs.TestStart:
-                ParseTestStart(payload, results);
-                return true;
+                ParseTestStart(payload, results, testsByNumber);
+                return FrameStatus.Parsed;
 
             case Ds2Vs.TestPass:
-                ParseTestPass(payload, results);
-                return true;
+                ParseTestPass(payload, testsByNumber);
+                return FrameStatus.Parsed;
 
             case Ds2Vs.TestFail:
-                ParseTestFail(payload, results);
-                return true;
+                ParseTestFail(payload, testsByNumber);
+                return FrameStatus.Parsed;
 
             case Ds2Vs.TestSkip:
-                ParseTestSkip(payload, results);
-                return true;
+                ParseTestSkip(payload, testsByNumber);
+                return FrameStatus.Parsed;
 
             case Ds2Vs.TestSuiteEnd:
                 ParseTestSuiteEnd(payload, results);
-                return true;
+                return FrameStatus.Parsed;
 
             case Ds2Vs.CoverageData:
                 ParseCoverageData(payload, results);
-                return true;
+                return FrameStatus.Parsed;
 
             case Ds2Vs.ArchitectureInfo:
                 // Architecture bootstrap message (arch + cpu count).
                 // Not used for test assertions, but must be consumed as a valid frame.
-                return true;
+                return FrameStatus.Parsed;
 
             case Ds2Vs.TestDestructiveReached:
                 // Sentinel for the engine's re-launch heuristic. The frame must be
                 // consumed as a valid message; no parsing into TestResults needed.
-                return true;
+                return FrameStatus.Parsed;
 
             default:
-                return false;
+                return FrameStatus.Invalid;
         }
     }
 
-    private static void ParseTestSuiteStart(byte[] payload, TestResults results)
+    private static void ParseTestSuiteStart(ReadOnlySpan<byte> payload, TestResults results)
     {
         if (payload.Length < UInt16FieldBytes)
         {
@@ -198,17 +185,17 @@ public class UartMessageParser
         }
 
         // Payload: [ExpectedTests:2][SuiteName:string]
-        string suiteName = Encoding.UTF8.GetString(payload, UInt16FieldBytes, payload.Length - UInt16FieldBytes);
+        string suiteName = Encoding.UTF8.GetString(payload.Slice(UInt16FieldBytes));
         if (HasControlChars(suiteName))
         {
             return;
         }
 
-        results.ExpectedTestCount = BitConverter.ToUInt16(payload, 0);
+        results.ExpectedTestCount = BinaryPrimitives.ReadUInt16LittleEndian(payload);
         results.SuiteName = suiteName;
     }
 
-    private static void ParseTestStart(byte[] payload, TestResults results)
+    private static void ParseTestStart(ReadOnlySpan<byte> payload, TestResults results, Dictionary<int, TestResult> testsByNumber)
     {
         // Payload: [TestNumber:2][TestName:string]
         if (payload.Length < UInt16FieldBytes)
@@ -216,8 +203,8 @@ public class UartMessageParser
             return;
         }
 
-        int testNumber = BitConverter.ToUInt16(payload, 0);
-        string testName = Encoding.UTF8.GetString(payload, UInt16FieldBytes, payload.Length - UInt16FieldBytes);
+        int testNumber = BinaryPrimitives.ReadUInt16LittleEndian(payload);
+        string testName = Encoding.UTF8.GetString(payload.Slice(UInt16FieldBytes));
 
         // Defensive: a non-protocol byte sequence in UART (e.g. an IRQ handler
         // calling Serial.WriteString mid-frame) can interleave with a real
@@ -232,23 +219,24 @@ public class UartMessageParser
             return;
         }
 
-        TestResult? existingTest = results.Tests.Find(t => t.TestNumber == testNumber);
-        if (existingTest != null)
+        if (testsByNumber.TryGetValue(testNumber, out TestResult? existingTest))
         {
             existingTest.TestName = testName;
             return;
         }
 
         // Add test with pending status
-        results.Tests.Add(new TestResult
+        var test = new TestResult
         {
             TestNumber = testNumber,
             TestName = testName,
             Status = TestStatus.Passed // Will be updated by Pass/Fail/Skip
-        });
+        };
+        results.Tests.Add(test);
+        testsByNumber.Add(testNumber, test);
     }
 
-    private static void ParseTestPass(byte[] payload, TestResults results)
+    private static void ParseTestPass(ReadOnlySpan<byte> payload, Dictionary<int, TestResult> testsByNumber)
     {
         // Payload: [TestNumber:2][DurationMs:4]
         if (payload.Length < TestPassPayloadBytes)
@@ -256,10 +244,10 @@ public class UartMessageParser
             return;
         }
 
-        int testNumber = BitConverter.ToUInt16(payload, 0);
-        uint durationMs = BitConverter.ToUInt32(payload, UInt16FieldBytes);
+        int testNumber = BinaryPrimitives.ReadUInt16LittleEndian(payload);
+        uint durationMs = BinaryPrimitives.ReadUInt32LittleEndian(payload.Slice(UInt16FieldBytes));
 
-        TestResult? test = FindTestResult(results, testNumber);
+        TestResult? test = FindTestResult(testsByNumber, testNumber);
         if (test == null)
         {
             return;
@@ -282,7 +270,7 @@ public class UartMessageParser
         test.DurationMs = durationMs;
     }
 
-    private static void ParseTestFail(byte[] payload, TestResults results)
+    private static void ParseTestFail(ReadOnlySpan<byte> payload, Dictionary<int, TestResult> testsByNumber)
     {
         // Payload: [TestNumber:2][ErrorMessage:string]
         if (payload.Length < UInt16FieldBytes)
@@ -290,8 +278,8 @@ public class UartMessageParser
             return;
         }
 
-        int testNumber = BitConverter.ToUInt16(payload, 0);
-        string errorMessage = Encoding.UTF8.GetString(payload, UInt16FieldBytes, payload.Length - UInt16FieldBytes);
+        int testNumber = BinaryPrimitives.ReadUInt16LittleEndian(payload);
+        string errorMessage = Encoding.UTF8.GetString(payload.Slice(UInt16FieldBytes));
         if (HasControlChars(errorMessage))
         {
             return;
@@ -302,7 +290,7 @@ public class UartMessageParser
         // fabricating a result for it turns corruption into a phantom
         // "Test 51234" failure. A genuinely lost test still fails the run
         // via the expected-count gap ("Test did not execute").
-        TestResult? test = FindTestResult(results, testNumber);
+        TestResult? test = FindTestResult(testsByNumber, testNumber);
         if (test == null)
         {
             return;
@@ -312,7 +300,7 @@ public class UartMessageParser
         test.ErrorMessage = errorMessage;
     }
 
-    private static void ParseTestSkip(byte[] payload, TestResults results)
+    private static void ParseTestSkip(ReadOnlySpan<byte> payload, Dictionary<int, TestResult> testsByNumber)
     {
         // Payload: [TestNumber:2][Reason:string]
         if (payload.Length < UInt16FieldBytes)
@@ -320,14 +308,14 @@ public class UartMessageParser
             return;
         }
 
-        int testNumber = BitConverter.ToUInt16(payload, 0);
-        string reason = Encoding.UTF8.GetString(payload, UInt16FieldBytes, payload.Length - UInt16FieldBytes);
+        int testNumber = BinaryPrimitives.ReadUInt16LittleEndian(payload);
+        string reason = Encoding.UTF8.GetString(payload.Slice(UInt16FieldBytes));
         if (HasControlChars(reason))
         {
             return;
         }
 
-        TestResult? test = FindTestResult(results, testNumber);
+        TestResult? test = FindTestResult(testsByNumber, testNumber);
         if (test == null)
         {
             return;
@@ -337,7 +325,7 @@ public class UartMessageParser
         test.ErrorMessage = reason;
     }
 
-    private static void ParseTestSuiteEnd(byte[] payload, TestResults results)
+    private static void ParseTestSuiteEnd(ReadOnlySpan<byte> payload, TestResults results)
     {
         // Payload: [Total:2][Passed:2][Failed:2][Skipped:2]
         if (payload.Length < SuiteEndPayloadBytes)
@@ -345,10 +333,10 @@ public class UartMessageParser
             return;
         }
 
-        ushort total = BitConverter.ToUInt16(payload, 0);
-        ushort passed = BitConverter.ToUInt16(payload, SuiteEndPassedOffset);
-        ushort failed = BitConverter.ToUInt16(payload, SuiteEndFailedOffset);
-        ushort skipped = BitConverter.ToUInt16(payload, SuiteEndSkippedOffset);
+        ushort total = BinaryPrimitives.ReadUInt16LittleEndian(payload);
+        ushort passed = BinaryPrimitives.ReadUInt16LittleEndian(payload.Slice(SuiteEndPassedOffset));
+        ushort failed = BinaryPrimitives.ReadUInt16LittleEndian(payload.Slice(SuiteEndFailedOffset));
+        ushort skipped = BinaryPrimitives.ReadUInt16LittleEndian(payload.Slice(SuiteEndSkippedOffset));
 
         // Validate: total must equal passed + failed + skipped (catches corruption
         // from timer interrupt interleaving). Skips count: TR.Finish reports the
@@ -362,7 +350,7 @@ public class UartMessageParser
         }
     }
 
-    private static void ParseCoverageData(byte[] payload, TestResults results)
+    private static void ParseCoverageData(ReadOnlySpan<byte> payload, TestResults results)
     {
         // Payload: [HitCount:2][HitId1:2][HitId2:2]...
         if (payload.Length < UInt16FieldBytes)
@@ -370,32 +358,35 @@ public class UartMessageParser
             return;
         }
 
-        ushort hitCount = BitConverter.ToUInt16(payload, 0);
+        ushort hitCount = BinaryPrimitives.ReadUInt16LittleEndian(payload);
 
         Console.WriteLine($"[UartParser] Coverage data: {hitCount} methods hit");
 
         for (int i = 0; i < hitCount && (UInt16FieldBytes + i * UInt16FieldBytes + 1) < payload.Length; i++)
         {
-            ushort methodId = BitConverter.ToUInt16(payload, UInt16FieldBytes + i * UInt16FieldBytes);
+            ushort methodId = BinaryPrimitives.ReadUInt16LittleEndian(payload.Slice(UInt16FieldBytes + i * UInt16FieldBytes));
             results.CoverageHitMethodIds.Add(methodId);
         }
     }
 
-    private static TestResult? FindTestResult(TestResults results, int testNumber)
-        => results.Tests.Find(t => t.TestNumber == testNumber);
+    private static TestResult? FindTestResult(Dictionary<int, TestResult> testsByNumber, int testNumber)
+        => testsByNumber.GetValueOrDefault(testNumber);
 
     // Real protocol strings are ASCII identifiers / prose; anything below
     // 0x20 means the frame was assembled from interleaved UART bytes.
     private static bool HasControlChars(string value)
-    {
-        for (int i = 0; i < value.Length; i++)
-        {
-            if (value[i] < MinPrintableChar)
-            {
-                return true;
-            }
-        }
+        => value.AsSpan().IndexOfAnyInRange('\0', (char)(MinPrintableChar - 1)) >= 0;
+}
 
-        return false;
-    }
+/// <summary>
+/// Outcome of <see cref="UartMessageParser.TryParseMessage"/> at one candidate offset.
+/// </summary>
+internal enum FrameStatus
+{
+    /// <summary>A complete, valid frame was consumed.</summary>
+    Parsed,
+    /// <summary>Not a frame; resume the search one byte further.</summary>
+    Invalid,
+    /// <summary>Plausible header whose frame runs past the end of the data seen so far.</summary>
+    Incomplete
 }
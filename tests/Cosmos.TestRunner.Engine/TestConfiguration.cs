@@ -55,6 +55,13 @@ public class TestConfiguration
     /// </summary>
     public string UartLogPath { get; set; } = string.Empty;
 
+    /// <summary>
+    /// Optional file collecting the UART output of every profile and boot.
+    /// Each boot's log is appended as soon as that boot finishes, so a run that
+    /// crashes or is killed still leaves the output of the boots it completed.
+    /// </summary>
+    public string CombinedUartLogPath { get; set; } = string.Empty;
+
     /// <summary>
     /// Whether to keep build artifacts after test
     /// </summary>
@@ -1,5 +1,4 @@
 using System.Runtime.CompilerServices;
-using Cosmos.Kernel.Core.IO;
 
 namespace Cosmos.TestRunner.Framework;
 
@@ -66,49 +65,23 @@ public static unsafe class CoverageTracker
             return;
         }
 
-        // Build payload: [HitCount:2][HitId1:2][HitId2:2]...
-        int payloadSize = 2 + hitCount * 2;
-        var payload = new byte[payloadSize];
+        // Payload: [HitCount:2][HitId1:2][HitId2:2]...
+        // Framed and sent like every other protocol message, so the coverage
+        // dump also goes out with interrupts disabled and can't be split by
+        // IRQ-time UART traces.
+        var frame = TestRunner.NewFrame(CoverageData, 2 + hitCount * 2);
+        TestRunner.WriteUInt16(frame, TestRunner.FramePayloadOffset, (ushort)hitCount);
 
-        // Write HitCount (LE ushort)
-        payload[0] = (byte)(hitCount & 0xFF);
-        payload[1] = (byte)((hitCount >> 8) & 0xFF);
-
-        // Write hit method IDs
-        int offset = 2;
+        int offset = TestRunner.FramePayloadOffset + 2;
         for (int i = 0; i < MaxMethods; i++)
         {
             if (_hits.Data[i] != 0)
             {
-                payload[offset] = (byte)(i & 0xFF);
-                payload[offset + 1] = (byte)((i >> 8) & 0xFF);
+                TestRunner.WriteUInt16(frame, offset, (ushort)i);
                 offset += 2;
             }
         }
 
-        SendMessage(CoverageData, payload);
-    }
-
-    /// <summary>
-    /// Send a protocol message: [MAGIC:4][Command:1][Length:2][Payload:N]
-    /// </summary>
-    private static void SendMessage(byte command, byte[] payload)
-    {
-        // Magic signature (0x19740807 little-endian)
-        Serial.ComWrite(0x07);
-        Serial.ComWrite(0x08);
-        Serial.ComWrite(0x74);
-        Serial.ComWrite(0x19);
-
-        Serial.ComWrite(command);
-
-        ushort length = (ushort)payload.Length;
-        Serial.ComWrite((byte)(length & 0xFF));
-        Serial.ComWrite((byte)((length >> 8) & 0xFF));
-
-        foreach (var b in payload)
-        {
-            Serial.ComWrite(b);
-        }
+        TestRunner.SendFrame(frame);
     }
 }
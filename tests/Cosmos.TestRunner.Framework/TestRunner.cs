@@ -457,127 +457,141 @@ namespace Cosmos.TestRunner.Framework
         /// <summary>Payload size of a TestSuiteEnd message: four little-endian ushort counters (total, passed, failed, skipped).</summary>
         private const int SuiteEndPayloadSizeBytes = 8;
 
+        /// <summary>Size in bytes of a frame header: [MAGIC:4][Command:1][Length:2].</summary>
+        private const int FrameHeaderSizeBytes = 7;
+        /// <summary>Offset of the second magic byte within a frame.</summary>
+        private const int FrameMagicByte1Offset = 1;
+        /// <summary>Offset of the third magic byte within a frame.</summary>
+        private const int FrameMagicByte2Offset = 2;
+        /// <summary>Offset of the fourth magic byte within a frame.</summary>
+        private const int FrameMagicByte3Offset = 3;
+        /// <summary>Offset of the Command byte within a frame.</summary>
+        private const int FrameCommandOffset = 4;
+        /// <summary>Offset of the little-endian ushort payload Length within a frame.</summary>
+        private const int FrameLengthOffset = 5;
+        /// <summary>Offset of the first payload byte within a frame.</summary>
+        internal const int FramePayloadOffset = FrameHeaderSizeBytes;
+
         /// <summary>
-        /// Send a protocol message with format: [MAGIC:4][Command:1][Length:2][Payload:N]
-        /// Magic signature = 0x19740807 (SerialSignature from Consts.cs)
+        /// Allocate a whole protocol frame [MAGIC:4][Command:1][Length:2][Payload:N]
+        /// with the header already filled in; callers write the payload at
+        /// <see cref="FramePayloadOffset"/>. One allocation per message, no
+        /// intermediate payload or string buffers to copy from.
         /// </summary>
-        private static void SendMessage(byte command, byte[] payload)
+        internal static byte[] NewFrame(byte command, int payloadLength)
         {
-            // The protocol shares the UART with diagnostic traces written from IRQ handlers
-            // and other threads ([SCHED]/[CV] wake logs). A frame must go out as one
-            // uninterrupted byte sequence: an IRQ landing mid-frame interleaves its log into
-            // the message and the host-side parser drops or garbles it.
-            using (InternalCpu.DisableInterruptsScope())
+            var frame = new byte[FrameHeaderSizeBytes + payloadLength];
+            // Magic signature (0x19740807 little-endian)
+            frame[0] = SerialSignatureByte0;
+            frame[FrameMagicByte1Offset] = SerialSignatureByte1;
+            frame[FrameMagicByte2Offset] = SerialSignatureByte2;
+            frame[FrameMagicByte3Offset] = SerialSignatureByte3;
+            frame[FrameCommandOffset] = command;
+            WriteUInt16(frame, FrameLengthOffset, (ushort)payloadLength);
+            return frame;
+        }
+
+        internal static void WriteUInt16(byte[] buffer, int offset, ushort value)
+        {
+            buffer[offset] = (byte)(value & ByteMask);
+            buffer[offset + 1] = (byte)((value >> Byte1Shift) & ByteMask);
+        }
+
+        private static void WriteUInt32(byte[] buffer, int offset, uint value)
+        {
+            buffer[offset] = (byte)(value & ByteMask);
+            buffer[offset + 1] = (byte)((value >> Byte1Shift) & ByteMask);
+            buffer[offset + 2] = (byte)((value >> Byte2Shift) & ByteMask);
+            buffer[offset + 3] = (byte)((value >> Byte3Shift) & ByteMask);
+        }
+
+        /// <summary>
+        /// Write a string as one byte per char (ASCII only for simplicity)
+        /// </summary>
+        private static void WriteAscii(byte[] buffer, int offset, string str)
+        {
+            for (int i = 0; i < str.Length; i++)
             {
-                // Send magic signature (0x19740807 little-endian)
-                Serial.ComWrite(SerialSignatureByte0);
-                Serial.ComWrite(SerialSignatureByte1);
-                Serial.ComWrite(SerialSignatureByte2);
-                Serial.ComWrite(SerialSignatureByte3);
-
-                // Send command byte
-                Serial.ComWrite(command);
-
-                // Send length (little-endian ushort)
-                ushort length = (ushort)payload.Length;
-                Serial.ComWrite((byte)(length & ByteMask));
-                Serial.ComWrite((byte)((length >> Byte1Shift) & ByteMask));
-
-                // Send payload
-                foreach (var b in payload)
-                {
-                    Serial.ComWrite(b);
-                }
+                buffer[offset + i] = (byte)str[i];
             }
         }
 
         /// <summary>
-        /// Encode string to UTF-8 bytes (simplified, assumes ASCII for kernel)
+        /// Send a frame built by <see cref="NewFrame"/>.
         /// </summary>
-        private static byte[] EncodeString(string str)
+        internal static void SendFrame(byte[] frame)
         {
-            var bytes = new byte[str.Length];
-            for (int i = 0; i < str.Length; i++)
+            // The protocol shares the UART with diagnostic traces written from IRQ handlers
+            // and other threads ([SCHED]/[CV] wake logs). A frame must go out as one
+            // uninterrupted byte sequence: an IRQ landing mid-frame interleaves its log into
+            // the message and the host-side parser drops or garbles it. The frame is fully
+            // packed beforehand, so interrupts stay off only for the UART writes themselves.
+            using (InternalCpu.DisableInterruptsScope())
             {
-                bytes[i] = (byte)str[i]; // ASCII only for simplicity
+                for (int i = 0; i < frame.Length; i++)
+                {
+                    Serial.ComWrite(frame[i]);
+                }
             }
-            return bytes;
         }
 
         private static void SendTestSuiteStart(string suiteName, ushort expectedTests)
         {
-            var nameBytes = EncodeString(suiteName);
-            var payload = new byte[UInt16FieldSizeBytes + nameBytes.Length];
-            // First 2 bytes: expected test count
-            payload[0] = (byte)(expectedTests & ByteMask);
-            payload[1] = (byte)((expectedTests >> Byte1Shift) & ByteMask);
-            // Rest: suite name
-            Array.Copy(nameBytes, 0, payload, UInt16FieldSizeBytes, nameBytes.Length);
-            SendMessage(TestSuiteStart, payload);
+            // Payload: [ExpectedTests:2][SuiteName:string]
+            var frame = NewFrame(TestSuiteStart, UInt16FieldSizeBytes + suiteName.Length);
+            WriteUInt16(frame, FramePayloadOffset, expectedTests);
+            WriteAscii(frame, FramePayloadOffset + UInt16FieldSizeBytes, suiteName);
+            SendFrame(frame);
         }
 
         private static void SendTestStart(ushort testNumber, string testName)
         {
-            var nameBytes = EncodeString(testName);
-            var payload = new byte[UInt16FieldSizeBytes + nameBytes.Length];
-            payload[0] = (byte)(testNumber & ByteMask);
-            payload[1] = (byte)((testNumber >> Byte1Shift) & ByteMask);
-            Array.Copy(nameBytes, 0, payload, UInt16FieldSizeBytes, nameBytes.Length);
-            SendMessage(TestStart, payload);
+            var frame = NewFrame(TestStart, UInt16FieldSizeBytes + testName.Length);
+            WriteUInt16(frame, FramePayloadOffset, testNumber);
+            WriteAscii(frame, FramePayloadOffset + UInt16FieldSizeBytes, testName);
+            SendFrame(frame);
         }
 
         private static void SendTestPass(ushort testNumber, uint durationMs)
         {
-            var payload = new byte[TestPassPayloadSizeBytes];
-            payload[0] = (byte)(testNumber & ByteMask);
-            payload[1] = (byte)((testNumber >> Byte1Shift) & ByteMask);
-            payload[2] = (byte)(durationMs & ByteMask);
-            payload[3] = (byte)((durationMs >> Byte1Shift) & ByteMask);
-            payload[4] = (byte)((durationMs >> Byte2Shift) & ByteMask);
-            payload[5] = (byte)((durationMs >> Byte3Shift) & ByteMask);
-            SendMessage(TestPass, payload);
+            var frame = NewFrame(TestPass, TestPassPayloadSizeBytes);
+            WriteUInt16(frame, FramePayloadOffset, testNumber);
+            WriteUInt32(frame, FramePayloadOffset + UInt16FieldSizeBytes, durationMs);
+            SendFrame(frame);
         }
 
         private static void SendTestFail(ushort testNumber, string errorMessage)
         {
-            var errorBytes = EncodeString(errorMessage);
-            var payload = new byte[UInt16FieldSizeBytes + errorBytes.Length];
-            payload[0] = (byte)(testNumber & ByteMask);
-            payload[1] = (byte)((testNumber >> Byte1Shift) & ByteMask);
-            Array.Copy(errorBytes, 0, payload, UInt16FieldSizeBytes, errorBytes.Length);
-            SendMessage(TestFail, payload);
+            var frame = NewFrame(TestFail, UInt16FieldSizeBytes + errorMessage.Length);
+            WriteUInt16(frame, FramePayloadOffset, testNumber);
+            WriteAscii(frame, FramePayloadOffset + UInt16FieldSizeBytes, errorMessage);
+            SendFrame(frame);
         }
 
         private static void SendTestSkip(ushort testNumber, string skipReason)
         {
-            var reasonBytes = EncodeString(skipReason);
-            var payload = new byte[UInt16FieldSizeBytes + reasonBytes.Length];
-            payload[0] = (byte)(testNumber & ByteMask);
-            payload[1] = (byte)((testNumber >> Byte1Shift) & ByteMask);
-            Array.Copy(reasonBytes, 0, payload, UInt16FieldSizeBytes, reasonBytes.Length);
-            SendMessage(TestSkip, payload);
+            var frame = NewFrame(TestSkip, UInt16FieldSizeBytes + skipReason.Length);
+            WriteUInt16(frame, FramePayloadOffset, testNumber);
+            WriteAscii(frame, FramePayloadOffset + UInt16FieldSizeBytes, skipReason);
+            SendFrame(frame);
         }
 
         private static void SendTestDestructiveReached(ushort testNumber)
         {
-            var payload = new byte[UInt16FieldSizeBytes];
-            payload[0] = (byte)(testNumber & ByteMask);
-            payload[1] = (byte)((testNumber >> Byte1Shift) & ByteMask);
-            SendMessage(TestDestructiveReached, payload);
+            var frame = NewFrame(TestDestructiveReached, UInt16FieldSizeBytes);
+            WriteUInt16(frame, FramePayloadOffset, testNumber);
+            SendFrame(frame);
         }
 
         private static void SendTestSuiteEnd(ushort total, ushort passed, ushort failed, ushort skipped)
         {
-            var payload = new byte[SuiteEndPayloadSizeBytes];
-            payload[0] = (byte)(total & ByteMask);
-            payload[1] = (byte)((total >> Byte1Shift) & ByteMask);
-            payload[2] = (byte)(passed & ByteMask);
-            payload[3] = (byte)((passed >> Byte1Shift) & ByteMask);
-            payload[4] = (byte)(failed & ByteMask);
-            payload[5] = (byte)((failed >> Byte1Shift) & ByteMask);
-            payload[6] = (byte)(skipped & ByteMask);
-            payload[7] = (byte)((skipped >> Byte1Shift) & ByteMask);
-            SendMessage(TestSuiteEnd, payload);
+            // Payload: [Total:2][Passed:2][Failed:2][Skipped:2]
+            var frame = NewFrame(TestSuiteEnd, SuiteEndPayloadSizeBytes);
+            WriteUInt16(frame, FramePayloadOffset, total);
+            WriteUInt16(frame, FramePayloadOffset + UInt16FieldSizeBytes, passed);
+            WriteUInt16(frame, FramePayloadOffset + 2 * UInt16FieldSizeBytes, failed);
+            WriteUInt16(frame, FramePayloadOffset + 3 * UInt16FieldSizeBytes, skipped);
+            SendFrame(frame);
         }
 
         #endregion
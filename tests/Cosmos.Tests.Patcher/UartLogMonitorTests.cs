@@ -0,0 +1,129 @@
+using System;
+using System.IO;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+using Cosmos.TestRunner.Engine;
+using Cosmos.TestRunner.Engine.Hosts;
+using Cosmos.TestRunner.Protocol;
+
+namespace Cosmos.Tests.Patcher;
+
+[Collection("PatcherTests")]
+public class UartLogMonitorTests
+{
+    /// <summary>Upper bound on how long a test waits for the monitor to decide, in milliseconds.</summary>
+    private const int MonitorTimeoutMs = 10_000;
+
+    /// <summary>Interval at which a test polls the monitor's read position, in milliseconds.</summary>
+    private const int PositionPollMs = 10;
+
+    /// <summary>Pause long enough for <see cref="DateTime.UtcNow"/> to visibly advance, in milliseconds.</summary>
+    private const int ClockAdvanceMs = 50;
+
+    /// <summary>ASCII text standing in for ordinary kernel output around protocol frames.</summary>
+    private static readonly byte[] BootText = Encoding.ASCII.GetBytes("boot text ");
+
+    /// <summary>Frame magic followed by the TestPass command byte.</summary>
+    private static readonly byte[] TestPassPrefix =
+    {
+        Consts.SerialSignatureByte0,
+        Consts.SerialSignatureByte1,
+        Consts.SerialSignatureByte2,
+        Consts.SerialSignatureByte3,
+        Ds2Vs.TestPass
+    };
+
+    [Fact]
+    public async Task RunAsync_FindsEndMarkerSplitAcrossReads()
+    {
+        string path = Path.Combine(Path.GetTempPath(), $"uart-monitor-{Guid.NewGuid():N}.log");
+        try
+        {
+            byte[] marker = Consts.SuiteEndMarker;
+            byte[] head = [.. BootText, .. marker.AsSpan(0, 3)];
+            await File.WriteAllBytesAsync(path, head);
+
+            using CancellationTokenSource cts = new(MonitorTimeoutMs);
+            using UartLogMonitor monitor = new(path);
+            Task<UartMonitorOutcome> run = monitor.RunAsync(cts.Token);
+
+            // Only append once the first read consumed the head, so the marker
+            // really straddles two reads.
+            while (monitor.Position < head.Length)
+            {
+                cts.Token.ThrowIfCancellationRequested();
+                await Task.Delay(PositionPollMs);
+            }
+            Assert.False(run.IsCompleted);
+
+            await using (FileStream fs = new(path, FileMode.Append, FileAccess.Write, FileShare.ReadWrite))
+            {
+                await fs.WriteAsync(marker.AsMemory(3));
+            }
+
+            Assert.Equal(UartMonitorOutcome.EndMarkerSeen, await run);
+        }
+        finally
+        {
+            File.Delete(path);
+        }
+    }
+
+    [Fact]
+    public void ScanChunk_FindsEndMarkerAtEverySplitPoint()
+    {
+        byte[] marker = Consts.SuiteEndMarker;
+        for (int split = 1; split < marker.Length; split++)
+        {
+            using UartLogMonitor monitor = new("unused.log");
+
+            Assert.False(monitor.ScanChunk([.. BootText, .. marker.AsSpan(0, split)]));
+            Assert.True(monitor.ScanChunk(marker.AsSpan(split)));
+        }
+    }
+
+    [Fact]
+    public void ScanChunk_DetectsTestPassAtEverySplitPoint()
+    {
+        for (int split = 1; split < TestPassPrefix.Length; split++)
+        {
+            using UartLogMonitor monitor = new("unused.log");
+
+            monitor.ScanChunk([.. BootText, .. TestPassPrefix.AsSpan(0, split)]);
+            Assert.False(monitor.SawTestPass);
+
+            monitor.ScanChunk(TestPassPrefix.AsSpan(split));
+            Assert.True(monitor.SawTestPass);
+        }
+    }
+
+    [Fact]
+    public void ScanChunk_IgnoresMagicWithOtherCommandForTestPass()
+    {
+        using UartLogMonitor monitor = new("unused.log");
+
+        monitor.ScanChunk([.. TestPassPrefix.AsSpan(0, Consts.SerialSignatureLengthBytes), Ds2Vs.TestStart]);
+
+        Assert.False(monitor.SawTestPass);
+    }
+
+    [Fact]
+    public async Task ScanChunk_CountsMagicOnlyOnceAcrossCarriedTail()
+    {
+        // The stall check keys on the time of the last magic. A magic left in
+        // the carried tail must not refresh it again on the next read, or a
+        // hung kernel printing plain text would never be declared stalled.
+        using UartLogMonitor monitor = new("unused.log");
+        DateTime created = monitor.LastMagicAt;
+
+        await Task.Delay(ClockAdvanceMs);
+        monitor.ScanChunk([.. BootText, .. TestPassPrefix.AsSpan(0, Consts.SerialSignatureLengthBytes)]);
+        DateTime magicSeen = monitor.LastMagicAt;
+        Assert.True(magicSeen > created);
+
+        await Task.Delay(ClockAdvanceMs);
+        monitor.ScanChunk(BootText);
+        Assert.Equal(magicSeen, monitor.LastMagicAt);
+    }
+}
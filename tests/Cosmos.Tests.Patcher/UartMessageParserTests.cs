@@ -107,6 +107,41 @@ public class UartMessageParserTests
         Assert.Equal(0, results.FailedTests);
     }
 
+    [Fact]
+    public void UartMessageDecoder_ByteByByteFeedMatchesOneShotParse()
+    {
+        // Streaming capture splits frames at arbitrary read boundaries; the
+        // decoder must buffer partial frames and end up where the one-shot
+        // parser does. A truncated header in the middle must not swallow
+        // the frames behind it.
+        List<byte> stream = new();
+        stream.AddRange(Encoding.ASCII.GetBytes("boot text\n"));
+        stream.AddRange(CreateFrame(Ds2Vs.TestSuiteStart, [2, 0, (byte)'S', (byte)'u', (byte)'i', (byte)'t', (byte)'e']));
+        stream.AddRange(CreateFrame(Ds2Vs.TestStart, [1, 0, (byte)'A']));
+        stream.AddRange([FrameMagicByte0, FrameMagicByte1, FrameMagicByte2, FrameMagicByte3, Ds2Vs.TestFail]);
+        stream.AddRange(CreateFrame(Ds2Vs.TestPass, [1, 0, 5, 0, 0, 0]));
+        stream.AddRange(CreateFrame(Ds2Vs.TestStart, [2, 0, (byte)'B']));
+        stream.AddRange(CreateFrame(Ds2Vs.TestFail, [2, 0, (byte)'x']));
+        stream.AddRange(CreateFrame(Ds2Vs.TestSuiteEnd, [2, 0, 1, 0, 1, 0, 0, 0]));
+        byte[] bytes = stream.ToArray();
+
+        TestResults expected = UartMessageParser.ParseUartLog(Encoding.Latin1.GetString(bytes), "x64");
+
+        UartMessageDecoder decoder = new("x64");
+        for (int i = 0; i < bytes.Length; i++)
+        {
+            decoder.Feed(bytes.AsSpan(i, 1));
+        }
+        TestResults actual = decoder.Complete();
+
+        Assert.True(actual.SuiteCompleted);
+        Assert.Equal(expected.SuiteName, actual.SuiteName);
+        Assert.Equal(expected.TotalTests, actual.TotalTests);
+        Assert.Equal(expected.Tests.Count, actual.Tests.Count);
+        Assert.Equal(1, actual.PassedTests);
+        Assert.Equal(1, actual.FailedTests);
+    }
+
     private static byte[] CreateFrame(byte command, byte[] payload)
     {
         List<byte> bytes = new();
@@ -0,0 +1,141 @@
+using Cosmos.Tools.Platform;
+
+namespace Cosmos.Tests.Tools;
+
+public class ToolResolverTests : IDisposable
+{
+    private const UnixFileMode ExecutableMode = UnixFileMode.UserRead | UnixFileMode.UserWrite | UnixFileMode.UserExecute;
+    private const UnixFileMode PlainMode = UnixFileMode.UserRead | UnixFileMode.UserWrite;
+
+    // Every test gets fresh directories, so entries ToolResolver cached for
+    // another test never match these paths.
+    private readonly string _root = Path.Combine(Path.GetTempPath(), $"cosmos-resolver-test-{Guid.NewGuid():N}");
+
+    public void Dispose()
+    {
+        try
+        {
+            Directory.Delete(_root, recursive: true);
+        }
+        catch
+        {
+        }
+    }
+
+    [Fact]
+    public void FindOnPath_Windows_TriesPathExtInOrder()
+    {
+        string dir = CreateDir("bin");
+        CreateFile(dir, "tool.cmd");
+        CreateFile(dir, "tool.exe");
+
+        Assert.Equal(Path.Combine(dir, "tool.cmd"), ToolResolver.FindOnPath("tool", dir, isWindows: true, ".CMD;.EXE"));
+        Assert.Equal(Path.Combine(dir, "tool.exe"), ToolResolver.FindOnPath("tool", dir, isWindows: true, ".EXE;.CMD"));
+    }
+
+    [Fact]
+    public void FindOnPath_Windows_IgnoresExtensionlessFile()
+    {
+        string first = CreateDir("first");
+        string second = CreateDir("second");
+        CreateFile(first, "tool");
+        CreateFile(second, "tool.exe");
+
+        string pathVar = string.Join(Path.PathSeparator, first, second);
+
+        Assert.Equal(Path.Combine(second, "tool.exe"), ToolResolver.FindOnPath("tool", pathVar, isWindows: true, ".EXE"));
+    }
+
+    [Fact]
+    public void FindOnPath_Windows_KeepsExplicitExtension()
+    {
+        string dir = CreateDir("bin");
+        CreateFile(dir, "tool.exe");
+
+        Assert.Equal(Path.Combine(dir, "tool.exe"), ToolResolver.FindOnPath("tool.exe", dir, isWindows: true, ".EXE"));
+    }
+
+    [Fact]
+    public void FindOnPath_Windows_MatchesCaseInsensitivelyAndReturnsActualName()
+    {
+        string dir = CreateDir("bin");
+        CreateFile(dir, "Tool.EXE");
+
+        Assert.Equal(Path.Combine(dir, "Tool.EXE"), ToolResolver.FindOnPath("tool", dir, isWindows: true, ".exe"));
+    }
+
+    [Fact]
+    public void FindOnPath_StripsQuotesFromPathEntries()
+    {
+        string dir = CreateDir("quoted dir");
+        CreateFile(dir, "tool.exe");
+
+        Assert.Equal(Path.Combine(dir, "tool.exe"), ToolResolver.FindOnPath("tool", $"\"{dir}\"", isWindows: true, ".EXE"));
+    }
+
+    [Fact]
+    public void ListPathDirectory_ComparerFollowsCaseSensitivity()
+    {
+        string dir = CreateDir("bin");
+        CreateFile(dir, "Tool");
+
+        Assert.Contains("tool", ToolResolver.ListPathDirectory(dir, ignoreCase: true));
+        Assert.DoesNotContain("tool", ToolResolver.ListPathDirectory(dir, ignoreCase: false));
+        Assert.Empty(ToolResolver.ListPathDirectory(Path.Combine(_root, "missing"), ignoreCase: false));
+    }
+
+    [Fact]
+    public void FindOnPath_Unix_SkipsFilesWithoutExecuteBit()
+    {
+        if (OperatingSystem.IsWindows())
+        {
+            return;
+        }
+
+        string first = CreateDir("first");
+        string second = CreateDir("second");
+        File.SetUnixFileMode(CreateFile(first, "tool"), PlainMode);
+        File.SetUnixFileMode(CreateFile(second, "tool"), ExecutableMode);
+
+        Assert.False(ToolResolver.IsExecutable(Path.Combine(first, "tool")));
+        Assert.True(ToolResolver.IsExecutable(Path.Combine(second, "tool")));
+
+        string pathVar = string.Join(Path.PathSeparator, first, second);
+        Assert.Equal(Path.Combine(second, "tool"), ToolResolver.FindOnPath("tool", pathVar, isWindows: false, null));
+    }
+
+    [Fact]
+    public void InvalidateCache_RelistsPathDirectories()
+    {
+        if (OperatingSystem.IsWindows())
+        {
+            return;
+        }
+
+        string first = CreateDir("first");
+        string second = CreateDir("second");
+        File.SetUnixFileMode(CreateFile(first, "tool"), PlainMode);
+        string pathVar = string.Join(Path.PathSeparator, first, second);
+
+        Assert.Null(ToolResolver.FindOnPath("tool", pathVar, isWindows: false, null));
+
+        // The empty listing of the second directory is cached until invalidated
+        File.SetUnixFileMode(CreateFile(second, "tool"), ExecutableMode);
+        Assert.Null(ToolResolver.FindOnPath("tool", pathVar, isWindows: false, null));
+
+        ToolResolver.InvalidateCache();
+        Assert.Equal(Path.Combine(second, "tool"), ToolResolver.FindOnPath("tool", pathVar, isWindows: false, null));
+    }
+
+    private string CreateDir(string name)
+    {
+        return Directory.CreateDirectory(Path.Combine(_root, name)).FullName;
+    }
+
+    private static string CreateFile(string dir, string name)
+    {
+        string path = Path.Combine(dir, name);
+        File.WriteAllText(path, string.Empty);
+        return path;
+    }
+}